@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from time import monotonic, time
 from typing import Any
-from ..utils.helpers import utcnow
 
 
 @dataclass(slots=True)
@@ -9,22 +9,26 @@ class CacheEntry:
     """
     INTERNAL.
 
-    Represents a single cache entry with an absolute expiration time.
+    Represents a single cache entry with an absolute expiration deadline.
 
     Purpose:
         Encapsulates the cached value along with TTL metadata and a computed
         expiration timestamp.
 
     Invariants:
-        - expiration_time is always timezone-aware (UTC)
-        - ttl is the original TTL (in seconds) used to compute expiration_time
+        - expiration_ts is a `time.monotonic()` deadline (or None for
+          entries that never expire), so expiry checks are a single float
+          compare with no datetime construction involved
+        - ttl is the original TTL (in seconds) used to compute expiration_ts
 
     Notes:
         This class is not part of the public API and may change without notice.
+        Monotonic deadlines are process-local; `to_dict`/`from_dict` translate
+        them to and from wall-clock epoch seconds at persistence boundaries.
     """
 
     value: Any
-    expiration_time: datetime
+    expiration_ts: "float | None"
     ttl: int
 
     def to_dict(self) -> dict:
@@ -38,41 +42,89 @@ class CacheEntry:
             into a JSON-compatible format.
 
         Behavior:
-            - Converts expiration_time to ISO 8601 string
+            - Translates the process-local monotonic deadline into a float
+              epoch timestamp (JSON-native, meaningful across processes)
             - Does not perform deep serialization of the value
         """
 
+        deadline = self.expiration_ts
+
         return {
             "value": self.value,
-            "expiration_time": self.expiration_time.isoformat(),  # Handle datetime conversion here
+            "expiration_time": (
+                time() + (deadline - monotonic()) if deadline is not None else None
+            ),
             "ttl": self.ttl,
         }
 
+    def __reduce__(self):
+        """
+        INTERNAL.
+
+        Pickle support that survives process boundaries.
+
+        Purpose:
+            Monotonic deadlines are meaningless in another process, and the
+            default slots-dataclass pickling would also drag a state dict
+            along. Reducing to a plain (value, wall_deadline, ttl) call keeps
+            the payload three scalars and re-anchors the deadline on load.
+        """
+
+        deadline = self.expiration_ts
+        wall = time() + (deadline - monotonic()) if deadline is not None else None
+        return (CacheEntry._from_wall, (self.value, wall, self.ttl))
+
+    @classmethod
+    def _from_wall(cls, value: Any, wall: "float | None", ttl: int) -> "CacheEntry":
+        """
+        INTERNAL.
+
+        Rebuild an entry from a wall-clock epoch deadline.
+
+        Used as the pickle reconstructor; translates the persisted epoch
+        deadline back onto this process's monotonic clock.
+        """
+
+        deadline = monotonic() + (wall - time()) if wall is not None else None
+        return cls(value=value, expiration_ts=deadline, ttl=ttl)
+
     @classmethod
     def from_dict(cls, data: dict) -> "CacheEntry":
         """
         INTERNAL.
 
-        Serialize this cache entry into a dictionary representation.
+        Reconstruct a cache entry from its dictionary representation.
 
         Purpose:
-            Used by serializers and persistence layers to convert cache entries
-            into a JSON-compatible format.
+            Used by serializers and persistence layers to rebuild cache entries
+            from a JSON-compatible format.
 
         Behavior:
-            - Converts expiration_time to ISO 8601 string
-            - Does not perform deep serialization of the value
+            - Translates the persisted float epoch timestamp back into a
+              monotonic deadline relative to the current process clock
+            - Files written before the epoch-float format carry ISO 8601
+              strings instead; those are parsed once here and never
+              re-emitted, so the slow path only runs on legacy data
         """
 
-        expiration = datetime.fromisoformat(data["expiration_time"])
-
-        # Ensure timezone awareness as fromisoformat may return naive datetime
-        if expiration.tzinfo is None:
-            expiration = expiration.replace(tzinfo=timezone.utc)
+        raw_expiration = data["expiration_time"]
+
+        if raw_expiration is None:
+            expiration = None
+        else:
+            if type(raw_expiration) is str:
+                # Legacy file: ISO 8601 timestamp from the datetime era
+                parsed = datetime.fromisoformat(raw_expiration)
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                raw_expiration = parsed.timestamp()
+            # Remaining wall-clock lifetime, re-anchored to this process's
+            # monotonic clock; already-expired entries land in the past
+            expiration = monotonic() + (raw_expiration - time())
 
         return cls(
             value=data["value"],
-            expiration_time=expiration,  # Revert string to datetime
+            expiration_ts=expiration,
             ttl=data["ttl"],
         )
 
@@ -83,14 +135,13 @@ class CacheEntry:
         Check whether this cache entry has expired.
 
         Behavior:
-            - Compares the current UTC time against expiration_time
+            - Compares the current monotonic clock against expiration_ts;
+              a single float compare on the hot path
             - Does not mutate cache state
 
         Returns:
             bool: True if the entry is expired, False otherwise.
         """
 
-        if self.expiration_time is None:
-            return False
-        return utcnow() >= self.expiration_time
-
+        deadline = self.expiration_ts
+        return deadline is not None and monotonic() >= deadline
@@ -1,12 +1,11 @@
 from collections import OrderedDict
-from datetime import timedelta
 from threading import RLock
+from time import monotonic
 from typing import Any, Iterable, Dict
-from enum import Enum, auto
+from enum import IntEnum
 from dataclasses import dataclass
 import sys
 
-from ..utils.helpers import utcnow
 from .base import BaseCacheBackend
 from .mixins import (
     BulkOperationsMixin,
@@ -25,12 +24,21 @@ from ..registry.decorators import register_cache_backend
 class InMemoryBackendConfig:
     pass
 
-class KeyStatus(Enum):
+# Plain-int mirrors of the KeyStatus members. The cache core's hot paths
+# return and compare these bare ints (one LOAD_FAST + COMPARE_OP), while
+# KeyStatus remains the readable, documented form; IntEnum keeps the two
+# interchangeable in comparisons.
+KEY_MISSING = 0
+KEY_EXPIRED = 1
+KEY_VALID = 2
+
+
+class KeyStatus(IntEnum):
     """Internal enum representing the state of a cache key."""
 
-    MISSING = auto()
-    EXPIRED = auto()
-    VALID = auto()
+    MISSING = KEY_MISSING
+    EXPIRED = KEY_EXPIRED
+    VALID = KEY_VALID
 
 
 @register_cache_backend("inmemory")
@@ -244,7 +252,7 @@ class InMemoryBackend(
                 total += sys.getsizeof(entry)  # CacheEntry object itself
                 total += sys.getsizeof(entry.value)  # actual stored value
                 total += sys.getsizeof(entry.ttl)  # ttl entry
-                total += sys.getsizeof(entry.expiration_time)  # expiration time
+                total += sys.getsizeof(entry.expiration_ts)  # expiration deadline
         return total
 
     # -------------------------
@@ -268,10 +276,10 @@ class InMemoryBackend(
 
             entry = self._store[key]
 
-            if entry.expiration_time is None:
+            if entry.expiration_ts is None:
                 return -1
 
-            remaining = (entry.expiration_time - utcnow()).total_seconds()
+            remaining = entry.expiration_ts - monotonic()
             return max(0, int(remaining))
 
     def expire(self, key: str, ttl: int | None):
@@ -293,9 +301,9 @@ class InMemoryBackend(
             entry.ttl = ttl
 
             if ttl is None:
-                entry.expiration_time = None
+                entry.expiration_ts = None
             else:
-                entry.expiration_time = utcnow() + timedelta(seconds=ttl)
+                entry.expiration_ts = monotonic() + ttl
 
 
     # -------------------------
@@ -323,13 +331,11 @@ class InMemoryBackend(
     def _build_entry(self, value: Any, ttl: int | None) -> CacheEntry:
         """Build a CacheEntry object from a value and TTL."""
         if ttl is None:
-            expiration_time = None
+            expiration_ts = None
         else:
-            expiration_time = utcnow() + timedelta(seconds=ttl)
+            expiration_ts = monotonic() + ttl
 
-        entry = CacheEntry(
-            value=value, expiration_time=expiration_time, ttl=ttl
-        )
+        entry = CacheEntry(value=value, expiration_ts=expiration_ts, ttl=ttl)
         return entry
 
     def _write_entry(self, key: str, entry: CacheEntry):
@@ -14,6 +14,9 @@ class BaseCache(ABC):
         Do not instantiate directly; implement a concrete subclass.
     """
 
+    # Empty on purpose: lets slotted subclasses stay __dict__-free
+    __slots__ = ()
+
     @abstractmethod
     def get(self, key: str):
         """
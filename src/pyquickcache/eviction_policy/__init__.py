@@ -1,7 +1,7 @@
 from .base import BaseEvictionPolicy
 from .lru import LRUEvictionPolicy
 from .fifo import FIFOEvictionPolicy
-from .lfu import LFUEvictionPolicy
+from .lfu import LFUEvictionPolicy, FastLFUEvictionPolicy
 
 # Optional: define __all__ to control what 'from eviction_policy import *' does
 __all__ = [
@@ -9,4 +9,5 @@ __all__ = [
     "LRUEvictionPolicy",
     "FIFOEvictionPolicy",
     "LFUEvictionPolicy",
+    "FastLFUEvictionPolicy",
 ]
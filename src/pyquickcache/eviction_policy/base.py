@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 
+# Message for the empty-cache guard in select_eviction_key
+# implementations. Only the message is shared: raising mutates the
+# exception (__traceback__, context chaining), so each raise site must
+# construct its own instance — a shared one would leak frames between
+# unrelated failures.
+_EMPTY_CACHE_MSG = "Eviction requested on empty cache"
+
+
 
 class BaseEvictionPolicy(ABC):
     """
@@ -18,6 +26,17 @@ class BaseEvictionPolicy(ABC):
         Do not instantiate directly; subclass this to create custom eviction policies.
     """
 
+    __slots__ = ()
+
+    NOOP_HOOKS: frozenset = frozenset()
+    """
+    Names of lifecycle hooks this policy implements as no-ops.
+
+    The cache uses this to skip the method call entirely on hot paths
+    (e.g. FIFO does nothing on access, so `get` never calls `on_access`).
+    Policies whose hooks all do real work can leave this empty.
+    """
+
     @abstractmethod
     def on_add(self, cache: OrderedDict, key: str) -> None:
         """
@@ -98,3 +117,42 @@ class BaseEvictionPolicy(ABC):
             Does NOT modify the cache directly.
         """
         pass
+
+    def on_access_many(self, cache: OrderedDict, keys: "list[str]") -> None:
+        """
+        Called once per bulk read with every key that was a valid hit.
+
+        The default implementation simply loops over `on_access`; policies
+        with cheaper batch bookkeeping can override it.
+
+        Args:
+            cache (OrderedDict): The cache's internal storage.
+            keys (list[str]): The keys that were accessed, in request order.
+
+        INTERNAL:
+            Optional override; used by get_many to avoid per-key dispatch.
+        """
+        on_access = self.on_access
+        for key in keys:
+            on_access(cache, key)
+
+    def pop_eviction_key(self, cache: OrderedDict) -> "tuple[str, object] | None":
+        """
+        Optionally select AND remove the eviction victim in one step.
+
+        Policies whose victim sits at a known position (FIFO, LRU) can
+        override this to pop the entry in a single OrderedDict operation,
+        avoiding the separate select + pop round trip.
+
+        Args:
+            cache (OrderedDict): The cache's internal storage.
+
+        Returns:
+            tuple[str, object] | None: The evicted (key, entry) pair, or
+            None if the policy does not support combined eviction. Callers
+            must fall back to `select_eviction_key` when None is returned.
+
+        INTERNAL:
+            Optional override; the default implementation opts out.
+        """
+        return None
@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from .base import BaseEvictionPolicy
+from .base import BaseEvictionPolicy, _EMPTY_CACHE_MSG
 
 from ..registry.decorators import register_eviction_policy
 
@@ -18,6 +18,10 @@ class FIFOEvictionPolicy(BaseEvictionPolicy):
         Subclasses BaseEvictionPolicy and implements required lifecycle methods.
     """
 
+    __slots__ = ()
+
+    NOOP_HOOKS = frozenset({"on_update", "on_access", "on_delete"})
+
     def on_add(self, cache, key) -> None:
         """
         Handles a newly added key.
@@ -90,5 +94,26 @@ class FIFOEvictionPolicy(BaseEvictionPolicy):
             Overrides BaseEvictionPolicy.select_eviction_key.
         """
         if not cache:
-            raise RuntimeError("Eviction requested on empty cache")
+            raise RuntimeError(_EMPTY_CACHE_MSG)
         return next(iter(cache))
+
+    def pop_eviction_key(self, cache: OrderedDict) -> tuple:
+        """
+        Selects and removes the eviction victim in one step.
+
+        The oldest inserted key is always first in the OrderedDict, so a
+        single `popitem(last=False)` both selects and removes it.
+
+        Args:
+            cache (OrderedDict): The cache's internal storage.
+
+        Returns:
+            tuple: The evicted (key, entry) pair.
+
+        Raises:
+            KeyError: If called when the cache is empty.
+
+        INTERNAL:
+            Overrides BaseEvictionPolicy.pop_eviction_key.
+        """
+        return cache.popitem(last=False)
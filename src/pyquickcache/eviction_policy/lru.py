@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from .base import BaseEvictionPolicy
+from .base import BaseEvictionPolicy, _EMPTY_CACHE_MSG
 
 from ..registry.decorators import register_eviction_policy
 
@@ -19,11 +19,17 @@ class LRUEvictionPolicy(BaseEvictionPolicy):
         Subclasses BaseEvictionPolicy and implements lifecycle methods.
     """
 
+    __slots__ = ()
+
+    NOOP_HOOKS = frozenset({"on_delete"})
+
     def on_add(self, cache, key) -> None:
         """
         Handles a newly added key.
 
-        Moves the key to the end to mark it as recently used.
+        Moves the key to the end to mark it as recently used. The cache only
+        fires this hook after inserting the key, so no membership check is
+        needed.
 
         Args:
             cache (OrderedDict): The cache's internal storage.
@@ -32,14 +38,15 @@ class LRUEvictionPolicy(BaseEvictionPolicy):
         INTERNAL:
             Overrides BaseEvictionPolicy.on_add.
         """
-        if key in cache:
-            cache.move_to_end(key)
+        cache.move_to_end(key)
 
     def on_update(self, cache: OrderedDict, key: str) -> None:
         """
         Handles an existing key being updated.
 
-        Moves the key to the end to mark it as recently used.
+        Moves the key to the end to mark it as recently used. The cache only
+        fires this hook for keys it just validated, so no membership check is
+        needed.
 
         Args:
             cache (OrderedDict): The cache's internal storage.
@@ -48,14 +55,15 @@ class LRUEvictionPolicy(BaseEvictionPolicy):
         INTERNAL:
             Overrides BaseEvictionPolicy.on_update.
         """
-        if key in cache:
-            cache.move_to_end(key)
+        cache.move_to_end(key)
 
     def on_access(self, cache: OrderedDict, key: str) -> None:
         """
         Handles a key being accessed.
 
-        Moves the key to the end to mark it as recently used.
+        Moves the key to the end to mark it as recently used. The cache only
+        fires this hook after a successful lookup, so no membership check is
+        needed — one hash probe per hit instead of two.
 
         Args:
             cache (OrderedDict): The cache's internal storage.
@@ -64,8 +72,7 @@ class LRUEvictionPolicy(BaseEvictionPolicy):
         INTERNAL:
             Overrides BaseEvictionPolicy.on_access.
         """
-        if key in cache:
-            cache.move_to_end(key)
+        cache.move_to_end(key)
 
     def on_delete(self, cache, key) -> None:
         """
@@ -99,5 +106,26 @@ class LRUEvictionPolicy(BaseEvictionPolicy):
             Overrides BaseEvictionPolicy.select_eviction_key.
         """
         if not cache:
-            raise RuntimeError("Eviction requested on empty cache")
+            raise RuntimeError(_EMPTY_CACHE_MSG)
         return next(iter(cache))
+
+    def pop_eviction_key(self, cache: OrderedDict) -> tuple:
+        """
+        Selects and removes the eviction victim in one step.
+
+        The least recently used key is always first in the OrderedDict, so a
+        single `popitem(last=False)` both selects and removes it.
+
+        Args:
+            cache (OrderedDict): The cache's internal storage.
+
+        Returns:
+            tuple: The evicted (key, entry) pair.
+
+        Raises:
+            KeyError: If called when the cache is empty.
+
+        INTERNAL:
+            Overrides BaseEvictionPolicy.pop_eviction_key.
+        """
+        return cache.popitem(last=False)
@@ -13,29 +13,22 @@ class NoOpEvictionPolicy(BaseEvictionPolicy):
         Subclasses BaseEvictionPolicy and implements required lifecycle methods.
     """
 
-    def on_add(self, cache, key) -> None:
-        """
-        Do nothing
-        """
-        pass
+    __slots__ = ()
 
-    def on_update(self, cache: OrderedDict, key: str) -> None:
-        """
-        Do nothing
-        """
-        pass
+    NOOP_HOOKS = frozenset({"on_add", "on_update", "on_access", "on_delete"})
 
-    def on_access(self, cache: OrderedDict, key: str) -> None:
+    @staticmethod
+    def _noop(cache, key) -> None:
         """
-        Do nothing
-        """
-        pass
+        Shared do-nothing lifecycle hook.
 
-    def on_delete(self, cache, key) -> None:
-        """
-        Do nothing
+        The cache core already skips hooks listed in NOOP_HOOKS entirely;
+        this single static function covers any caller that invokes the
+        hooks directly, without four separate method objects.
         """
-        pass
+        return None
+
+    on_add = on_update = on_access = on_delete = _noop
 
     def select_eviction_key(self, cache: OrderedDict) -> str:
         """
@@ -1,10 +1,27 @@
+__all__ = [
+    "CacheError",
+    "KeyNotFound",
+    "KeyExpired",
+    "KeyAlreadyExists",
+    "InvalidTTL",
+    "CacheSaveError",
+    "CacheLoadError",
+    "CacheMetricsSaveError",
+]
+
+
 class CacheError(Exception):
     """
     Base class for all cache-related errors.
 
+    Message formatting is deferred to `__str__`, so raising a cache error
+    costs no string allocation unless someone actually renders it (logs,
+    tracebacks). Callers that only inspect `err.code` or `err.key` pay
+    nothing.
+
     Attributes:
         code (str): Error code identifying the type of cache error.
-        message (str): Human-readable error message.
+        message (str): Human-readable error message (built on first access).
 
     INTERNAL:
         Subclass this for all custom cache exceptions.
@@ -19,8 +36,18 @@ class CacheError(Exception):
         Args:
             message (str | None): Optional custom error message. Defaults to class name.
         """
-        super().__init__(message or self.__class__.__name__)
-        self.message = message or self.__class__.__name__
+        # Pass the raw args through so BaseException.__reduce__ can
+        # reconstruct the instance on unpickling; formatting stays lazy.
+        Exception.__init__(self, message)
+        self._message = message
+
+    def __str__(self) -> str:
+        return self._message or self.__class__.__name__
+
+    @property
+    def message(self) -> str:
+        """The formatted error message (computed lazily)."""
+        return str(self)
 
 
 class KeyNotFound(CacheError):
@@ -41,9 +68,12 @@ class KeyNotFound(CacheError):
         Args:
             key (str): The key that was not found.
         """
-        super().__init__(f"Key '{key}' not found")
+        Exception.__init__(self, key)
         self.key = key
 
+    def __str__(self) -> str:
+        return f"Key '{self.key}' not found"
+
 
 class KeyExpired(CacheError):
     """
@@ -63,10 +93,12 @@ class KeyExpired(CacheError):
         Args:
             key (str): The key that has expired.
         """
-
-        super().__init__(f"Key '{key}' has expired")
+        Exception.__init__(self, key)
         self.key = key
 
+    def __str__(self) -> str:
+        return f"Key '{self.key}' has expired"
+
 
 class KeyAlreadyExists(CacheError):
     """
@@ -86,10 +118,12 @@ class KeyAlreadyExists(CacheError):
         Args:
             key (str): The key that already exists.
         """
-
-        super().__init__(f"Key '{key}' already exists")
+        Exception.__init__(self, key)
         self.key = key
 
+    def __str__(self) -> str:
+        return f"Key '{self.key}' already exists"
+
 
 class InvalidTTL(CacheError):
     """
@@ -109,9 +143,12 @@ class InvalidTTL(CacheError):
         Args:
             ttl (int): The invalid TTL value.
         """
-        super().__init__(f"Invalid TTL value: {ttl}")
+        Exception.__init__(self, ttl)
         self.ttl = ttl
 
+    def __str__(self) -> str:
+        return f"Invalid TTL value: {self.ttl}"
+
 
 class CacheSaveError(CacheError):
     """
@@ -133,13 +170,16 @@ class CacheSaveError(CacheError):
             filepath (str): File path where save failed.
             original_exception (Exception | None): Original exception, if any.
         """
-        message = f"Failed to save cache to disk: {filepath}"
-        if original_exception:
-            message += f" | {original_exception}"
-        super().__init__(message)
+        Exception.__init__(self, filepath, original_exception)
         self.filepath = filepath
         self.original_exception = original_exception
 
+    def __str__(self) -> str:
+        message = f"Failed to save cache to disk: {self.filepath}"
+        if self.original_exception:
+            message += f" | {self.original_exception}"
+        return message
+
 
 class CacheLoadError(CacheError):
     """
@@ -161,13 +201,16 @@ class CacheLoadError(CacheError):
             filepath (str): File path that failed to load.
             original_exception (Exception | None): Original exception, if any.
         """
-        message = f"Failed to load cache from disk: {filepath}"
-        if original_exception:
-            message += f" | {original_exception}"
-        super().__init__(message)
+        Exception.__init__(self, filepath, original_exception)
         self.filepath = filepath
         self.original_exception = original_exception
 
+    def __str__(self) -> str:
+        message = f"Failed to load cache from disk: {self.filepath}"
+        if self.original_exception:
+            message += f" | {self.original_exception}"
+        return message
+
 
 class CacheMetricsSaveError(CacheError):
     """
@@ -189,6 +232,9 @@ class CacheMetricsSaveError(CacheError):
             filepath (str): File path where metrics save failed.
             cause (Exception | None): Original cause exception, if any.
         """
-        super().__init__(f"Failed to save cache metrics to disk: {filepath}")
+        Exception.__init__(self, filepath, cause)
         self.filepath = filepath
         self.__cause__ = cause
+
+    def __str__(self) -> str:
+        return f"Failed to save cache metrics to disk: {self.filepath}"
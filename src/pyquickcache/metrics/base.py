@@ -1,8 +1,4 @@
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
-
-
-class BaseMetrics(ABC):
+class BaseMetrics:
     """
     Abstract base class defining the interface for cache metrics collection.
 
@@ -21,12 +17,17 @@ class BaseMetrics(ABC):
 
     Extensibility:
         Custom metrics backends (e.g., Prometheus, StatsD, OpenTelemetry)
-        should subclass this class and implement all abstract methods.
+        should subclass this class and override all methods. The class is a
+        plain base (not an ABC): skipping ABCMeta keeps isinstance/subclass
+        checks on type's fast path and avoids the metaclass import cost;
+        unimplemented methods raise NotImplementedError at call time instead
+        of instantiation time.
     """
 
+    __slots__ = ()
+
     # ---------- Event recording ----------
 
-    @abstractmethod
     def record_set(self):
         """
         Record a successful cache set operation.
@@ -34,9 +35,8 @@ class BaseMetrics(ABC):
         This method is called when a key-value pair is successfully stored
         in the cache.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def record_get(self):
         """
         Record an attempted cache get operation.
@@ -44,27 +44,45 @@ class BaseMetrics(ABC):
         This method is called for every `get` invocation, regardless of
         whether it results in a hit or a miss.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def record_hit(self):
         """
         Record a cache hit.
 
         A hit occurs when a requested key exists and has not expired.
         """
-        pass
+        raise NotImplementedError
+
+    def record_hits(self, count):
+        """
+        Record multiple cache hits at once.
+
+        Used by bulk operations to flush a locally tallied count in a
+        single call instead of one call per key.
+
+        Args:
+            count (int): Number of hits to record.
+        """
+        raise NotImplementedError
 
-    @abstractmethod
     def record_miss(self):
         """
         Record a cache miss.
 
         A miss occurs when a requested key does not exist or has expired.
         """
-        pass
+        raise NotImplementedError
+
+    def record_misses(self, count):
+        """
+        Record multiple cache misses at once.
+
+        Args:
+            count (int): Number of misses to record.
+        """
+        raise NotImplementedError
 
-    @abstractmethod
     def record_failed_op(self):
         """
         Record a failed cache operation.
@@ -72,9 +90,8 @@ class BaseMetrics(ABC):
         This includes failures due to invalid input, internal errors,
         or rejected operations.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def record_eviction(self):
         """
         Record an eviction event.
@@ -82,27 +99,42 @@ class BaseMetrics(ABC):
         Evictions occur when entries are removed automatically due to
         capacity limits or eviction policy decisions.
         """
-        pass
+        raise NotImplementedError
+
+    def record_evictions(self, count):
+        """
+        Record multiple eviction events at once.
+
+        Args:
+            count (int): Number of evictions to record.
+        """
+        raise NotImplementedError
 
-    @abstractmethod
     def record_expired_removal(self):
         """
         Record the removal of an expired cache entry.
 
         This is typically triggered during cleanup or lazy expiration.
         """
-        pass
+        raise NotImplementedError
+
+    def record_expired_removals(self, count):
+        """
+        Record the removal of multiple expired cache entries at once.
+
+        Args:
+            count (int): Number of expired entries removed.
+        """
+        raise NotImplementedError
 
-    @abstractmethod
     def record_manual_deletion(self):
         """
         Record the manual deletion of a single cache entry.
 
         This corresponds to explicit user-initiated delete operations.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def record_manual_deletions(self, count):
         """
         Record the manual deletion of multiple cache entries.
@@ -110,11 +142,19 @@ class BaseMetrics(ABC):
         Args:
             count (int): Number of keys removed in the operation.
         """
-        pass
+        raise NotImplementedError
+
+    def record_sets(self, count):
+        """
+        Record multiple successful set operations at once.
+
+        Args:
+            count (int): Number of sets to record.
+        """
+        raise NotImplementedError
 
     # ---------- State updates ----------
 
-    @abstractmethod
     def update_total_keys(self, length: int):
         """
         Update the total number of keys currently stored in the cache.
@@ -122,9 +162,8 @@ class BaseMetrics(ABC):
         Args:
             length (int): Current total number of cache entries.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def update_valid_keys(self, size: int):
         """
         Update the count of valid (non-expired) keys in the cache.
@@ -132,9 +171,8 @@ class BaseMetrics(ABC):
         Args:
             size (int): Number of valid cache entries.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def update_valid_keys_by_delta(self, delta: int):
         """
         Increment or decrement the count of valid cache entries.
@@ -142,11 +180,23 @@ class BaseMetrics(ABC):
         Args:
             delta (int): Change in valid key count (positive or negative).
         """
-        pass
+        raise NotImplementedError
+
+    def update_sizes(self, total: int, valid: int):
+        """
+        Update the total and valid key counts in one call.
+
+        Used by sweep and eviction paths, which always know both sizes
+        and would otherwise dispatch two methods back to back.
+
+        Args:
+            total (int): Current total number of cache entries.
+            valid (int): Number of valid (non-expired) cache entries.
+        """
+        raise NotImplementedError
 
     # ---------- Export / lifecycle ----------
 
-    @abstractmethod
     def snapshot(self) -> dict:
         """
         Return a snapshot of the current metrics state.
@@ -154,13 +204,12 @@ class BaseMetrics(ABC):
         Returns:
             dict: A dictionary containing metric names and their values.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def reset(self):
         """
         Reset all collected metrics to their initial state.
 
         This is typically used for testing or metric lifecycle management.
         """
-        pass
+        raise NotImplementedError
@@ -1,8 +1,10 @@
+from array import array
+
 from .base import BaseMetrics
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheMetricsData:
     """
     Container for all cache metrics counters and derived statistics.
@@ -119,163 +121,252 @@ class CacheMetricsData:
         """
         Convert metrics data to a fully serializable dictionary.
 
-        Includes both raw counters and derived metrics.
+        Includes both raw counters and derived metrics. The dict is built
+        explicitly rather than via dataclasses.asdict(), which walks the
+        instance with deep-copy semantics — needless work for a flat
+        struct of ints.
 
         Returns:
             dict: Dictionary representation of metrics.
         """
-        data = asdict(self)
-
-        data.update(
-            {
-                "hit_ratio": self.hit_ratio,
-                "miss_ratio": self.miss_ratio,
-                "get_set_ratio": self.get_set_ratio,
-                "eviction_rate": self.eviction_rate,
-                "expired_bloat": self.expired_bloat,
-                "waste_percentage": self.waste_percentage,
-            }
-        )
+        data = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "gets": self.gets,
+            "failed_ops": self.failed_ops,
+            "evictions": self.evictions,
+            "expired_removals": self.expired_removals,
+            "manual_deletions": self.manual_deletions,
+            "current_valid_keys": self.current_valid_keys,
+            "peak_valid_keys": self.peak_valid_keys,
+            "current_total_keys": self.current_total_keys,
+            "peak_total_keys": self.peak_total_keys,
+        }
+
+        # Derived metrics, inlined with shared local loads rather than six
+        # property dispatches (the properties remain for external callers)
+        gets = self.gets
+        sets = self.sets
+        total = self.current_total_keys
+        bloat = total - self.current_valid_keys
+
+        data["hit_ratio"] = self.hits / gets if gets > 0 else 0.0
+        data["miss_ratio"] = self.misses / gets if gets > 0 else 0.0
+        data["get_set_ratio"] = gets / sets if sets > 0 else 0.0
+        data["eviction_rate"] = self.evictions / sets if sets > 0 else 0.0
+        data["expired_bloat"] = bloat
+        data["waste_percentage"] = bloat / total * 100 if total > 0 else 0.0
 
         return data
 
 
+# Counter slot indices for the CacheMetrics array storage, pre-bound as
+# module-level ints so record_* methods pay one global load instead of a
+# namespace-class attribute chain. Order matches _COUNTER_NAMES below;
+# snapshot() zips the two together.
+(
+    _HITS,
+    _MISSES,
+    _SETS,
+    _GETS,
+    _FAILED_OPS,
+    _EVICTIONS,
+    _EXPIRED_REMOVALS,
+    _MANUAL_DELETIONS,
+    _CURRENT_VALID_KEYS,
+    _PEAK_VALID_KEYS,
+    _CURRENT_TOTAL_KEYS,
+    _PEAK_TOTAL_KEYS,
+) = range(12)
+
+
+_COUNTER_NAMES = (
+    "hits",
+    "misses",
+    "sets",
+    "gets",
+    "failed_ops",
+    "evictions",
+    "expired_removals",
+    "manual_deletions",
+    "current_valid_keys",
+    "peak_valid_keys",
+    "current_total_keys",
+    "peak_total_keys",
+)
+
+# name -> array slot, for attribute-style counter reads via __getattr__
+_COUNTER_INDEX = {name: index for index, name in enumerate(_COUNTER_NAMES)}
+
+
 class CacheMetrics(BaseMetrics):
     """
     Default in-memory metrics implementation for QuickCache.
 
-    This class records cache metrics using simple integer counters
-    and derives useful statistics such as hit ratio and eviction rate.
+    This class records cache metrics using a preallocated int64 array
+    (one slot per counter) and derives useful statistics such as hit
+    ratio and eviction rate on demand.
 
     Characteristics:
-        - Lightweight and fast
+        - Lightweight and fast: each record_* is a C-level array store,
+          with no dataclass descriptor chain in between
         - Thread-safe by design assumption (GIL-protected increments)
         - Never raises exceptions
         - Safe to disable by replacing with NoOpMetrics
     """
 
-    def __init__(self):
-        self._data = CacheMetricsData()
-
-    @property
-    def hits(self) -> int:
-        return self._data.hits
-
-    @property
-    def misses(self) -> int:
-        return self._data.misses
-
-    @property
-    def gets(self) -> int:
-        return self._data.gets
+    __slots__ = ("_counts",)
 
-    @property
-    def sets(self) -> int:
-        return self._data.sets
-
-    @property
-    def failed_ops(self) -> int:
-        return self._data.failed_ops
-
-    @property
-    def evictions(self) -> int:
-        return self._data.evictions
-
-    @property
-    def expired_removals(self) -> int:
-        return self._data.expired_removals
-
-    @property
-    def manual_deletions(self) -> int:
-        return self._data.manual_deletions
-
-    @property
-    def current_valid_keys(self) -> int:
-        return self._data.current_valid_keys
-
-    @property
-    def peak_valid_keys(self) -> int:
-        return self._data.peak_valid_keys
+    def __init__(self):
+        self._counts = array("q", [0] * len(_COUNTER_NAMES))
 
-    @property
-    def current_total_keys(self) -> int:
-        return self._data.current_total_keys
+    def __getattr__(self, name: str):
+        """
+        Resolve counter names (hits, misses, sets, ...) to array slots.
 
-    @property
-    def peak_total_keys(self) -> int:
-        return self._data.peak_total_keys
+        Only called on attribute miss, so regular attributes like `_counts`
+        stay on the fast path; this replaces a dozen identical one-line
+        property delegators.
+        """
+        try:
+            return self._counts[_COUNTER_INDEX[name]]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
 
     @property
     def hit_ratio(self) -> float:
-        return self._data.hit_ratio
+        counts = self._counts
+        gets = counts[_GETS]
+        return (counts[_HITS] / gets) if gets > 0 else 0.0
 
     @property
     def miss_ratio(self) -> float:
-        return self._data.miss_ratio
+        counts = self._counts
+        gets = counts[_GETS]
+        return (counts[_MISSES] / gets) if gets > 0 else 0.0
 
     @property
     def get_set_ratio(self) -> float:
-        return self._data.get_set_ratio
+        counts = self._counts
+        sets = counts[_SETS]
+        return (counts[_GETS] / sets) if sets > 0 else 0.0
 
     @property
     def eviction_rate(self) -> float:
-        return self._data.eviction_rate
+        counts = self._counts
+        sets = counts[_SETS]
+        return (counts[_EVICTIONS] / sets) if sets > 0 else 0.0
 
     @property
     def expired_bloat(self) -> int:
-        return self._data.expired_bloat
+        counts = self._counts
+        return counts[_CURRENT_TOTAL_KEYS] - counts[_CURRENT_VALID_KEYS]
 
     @property
     def waste_percentage(self) -> float:
-        return self._data.waste_percentage
+        counts = self._counts
+        total = counts[_CURRENT_TOTAL_KEYS]
+        if total <= 0:
+            return 0.0
+        return (total - counts[_CURRENT_VALID_KEYS]) / total * 100
 
     def record_set(self):
-        self._data.sets += 1
+        self._counts[_SETS] += 1
 
     def record_hit(self):
-        self._data.hits += 1
+        self._counts[_HITS] += 1
+
+    def record_hits(self, count):
+        self._counts[_HITS] += count
 
     def record_miss(self):
-        self._data.misses += 1
+        self._counts[_MISSES] += 1
+
+    def record_misses(self, count):
+        self._counts[_MISSES] += count
 
     def record_failed_op(self):
-        self._data.failed_ops += 1
+        self._counts[_FAILED_OPS] += 1
 
     def record_get(self):
-        self._data.gets += 1
+        self._counts[_GETS] += 1
 
     def record_eviction(self):
-        self._data.evictions += 1
+        self._counts[_EVICTIONS] += 1
+
+    def record_evictions(self, count):
+        self._counts[_EVICTIONS] += count
 
     def record_expired_removal(self):
-        self._data.expired_removals += 1
+        self._counts[_EXPIRED_REMOVALS] += 1
+
+    def record_expired_removals(self, count):
+        self._counts[_EXPIRED_REMOVALS] += count
 
     def record_manual_deletion(self):
-        self._data.manual_deletions += 1
+        self._counts[_MANUAL_DELETIONS] += 1
 
     def record_manual_deletions(self, count):
-        self._data.manual_deletions += count
+        self._counts[_MANUAL_DELETIONS] += count
+
+    def record_sets(self, count):
+        self._counts[_SETS] += count
 
     def update_total_keys(self, length: int):
-        self._data.current_total_keys = length
-        if self._data.current_total_keys > self._data.peak_total_keys:
-            self._data.peak_total_keys = self._data.current_total_keys
+        counts = self._counts
+        counts[_CURRENT_TOTAL_KEYS] = length
+        if length > counts[_PEAK_TOTAL_KEYS]:
+            counts[_PEAK_TOTAL_KEYS] = length
 
     def update_valid_keys(self, size: int):
-        self._data.current_valid_keys = size
-        if size > self._data.peak_valid_keys:
-            self._data.peak_valid_keys = size
+        counts = self._counts
+        counts[_CURRENT_VALID_KEYS] = size
+        if size > counts[_PEAK_VALID_KEYS]:
+            counts[_PEAK_VALID_KEYS] = size
+
+    def update_sizes(self, total: int, valid: int):
+        counts = self._counts
+        counts[_CURRENT_TOTAL_KEYS] = total
+        if total > counts[_PEAK_TOTAL_KEYS]:
+            counts[_PEAK_TOTAL_KEYS] = total
+        counts[_CURRENT_VALID_KEYS] = valid
+        if valid > counts[_PEAK_VALID_KEYS]:
+            counts[_PEAK_VALID_KEYS] = valid
 
     def update_valid_keys_by_delta(self, delta: int):
-        new_value = self._data.current_valid_keys + delta
-        self._data.current_valid_keys = max(0, new_value)
+        counts = self._counts
+        new_value = counts[_CURRENT_VALID_KEYS] + delta
+        # Inline clamp: cheaper than max(0, ...) on this per-write path
+        if new_value < 0:
+            new_value = 0
+        counts[_CURRENT_VALID_KEYS] = new_value
 
-        if self._data.current_valid_keys > self._data.peak_valid_keys:
-            self._data.peak_valid_keys = self._data.current_valid_keys
+        if new_value > counts[_PEAK_VALID_KEYS]:
+            counts[_PEAK_VALID_KEYS] = new_value
 
     def snapshot(self):
-        snapshot = self._data.to_dict()
+        counts = self._counts
+        snapshot = dict(zip(_COUNTER_NAMES, counts))
+
+        # Inline the derived ratios with shared local loads instead of six
+        # property dispatches; snapshot() is the only consumer that needs
+        # them all at once
+        gets = counts[_GETS]
+        sets = counts[_SETS]
+        total = counts[_CURRENT_TOTAL_KEYS]
+        bloat = total - counts[_CURRENT_VALID_KEYS]
+
+        snapshot["hit_ratio"] = counts[_HITS] / gets if gets > 0 else 0.0
+        snapshot["miss_ratio"] = counts[_MISSES] / gets if gets > 0 else 0.0
+        snapshot["get_set_ratio"] = gets / sets if sets > 0 else 0.0
+        snapshot["eviction_rate"] = counts[_EVICTIONS] / sets if sets > 0 else 0.0
+        snapshot["expired_bloat"] = bloat
+        snapshot["waste_percentage"] = bloat / total * 100 if total > 0 else 0.0
+
         return snapshot
 
     def reset(self):
-        self._data = CacheMetricsData()
+        self._counts = array("q", [0] * len(_COUNTER_NAMES))
@@ -17,6 +17,8 @@ class NoOpMetrics(BaseMetrics):
     empty or neutral values.
     """
 
+    __slots__ = ()
+
     def record_set(self):
         """Ignore set operation metrics."""
         pass
@@ -29,10 +31,18 @@ class NoOpMetrics(BaseMetrics):
         """Ignore cache hit metrics."""
         pass
 
+    def record_hits(self, count):
+        """Ignore bulk cache hit metrics."""
+        pass
+
     def record_miss(self):
         """Ignore cache miss metrics."""
         pass
 
+    def record_misses(self, count):
+        """Ignore bulk cache miss metrics."""
+        pass
+
     def record_failed_op(self):
         """Ignore failed operation metrics."""
         pass
@@ -41,14 +51,30 @@ class NoOpMetrics(BaseMetrics):
         """Ignore eviction metrics."""
         pass
 
+    def record_evictions(self, count):
+        """Ignore bulk eviction metrics."""
+        pass
+
     def record_expired_removal(self):
         """Ignore expired entry removal metrics."""
         pass
 
+    def record_expired_removals(self, count):
+        """Ignore bulk expired entry removal metrics."""
+        pass
+
     def record_manual_deletion(self):
         """Ignore manual deletion metrics."""
         pass
 
+    def record_manual_deletions(self, count):
+        """Ignore bulk manual deletion metrics."""
+        pass
+
+    def record_sets(self, count):
+        """Ignore bulk set operation metrics."""
+        pass
+
     def update_total_keys(self, length: int):
         """Ignore total key count updates."""
         pass
@@ -61,6 +87,10 @@ class NoOpMetrics(BaseMetrics):
         """Ignore incremental valid key updates."""
         pass
 
+    def update_sizes(self, total: int, valid: int):
+        """Ignore combined size updates."""
+        pass
+
     def snapshot(self) -> dict:
         """
         Return an empty metrics snapshot.
@@ -1,13 +1,18 @@
 from typing import Any, Optional
-from datetime import timedelta
 from collections import OrderedDict
+from time import monotonic
+import contextlib
+import heapq
+import sys
 import threading
 from dataclasses import dataclass
 import atexit
 
 from .base_cache import BaseCache
+from .eviction_policy.lru import LRUEvictionPolicy
 from .registry.registry import create_eviction_policy, create_serializer
-from .quick_cache_config import QuickCacheConfig
+from .backend._cache_entry import CacheEntry
+from .backend.inmemory import KEY_EXPIRED, KEY_MISSING, KEY_VALID
 from .storage import FileManager, FileSystemStorage
 from .metrics import CacheMetrics, NoOpMetrics
 from .exceptions import (
@@ -19,15 +24,58 @@ from .exceptions import (
     CacheSaveError,
     CacheMetricsSaveError,
 )
-from .utils.helpers import utcnow
 
 import logging
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Below this size the expiry heap is never compacted; rebuilding a
+# handful of pairs costs more in churn than the stale entries do in RAM.
+_HEAP_COMPACT_MIN = 64
 
-@dataclass
+
+def _resolve_ttl(ttl_sec, default: int) -> int:
+    """
+    INTERNAL.
+
+    Validate a TTL argument and resolve it to a positive integer.
+
+    Purpose:
+        Shared by every write path (set, add, update, set_many) in place of
+        the repeated None-check / validate / coerce block.
+
+    Behavior:
+        - None resolves to the configured default
+        - The common case — an int argument — is a single type check and
+          compare, with no exception frame set up
+        - Other types fall back to int() coercion
+        - The resolved int feeds one float add (monotonic() + ttl); no
+          timedelta objects are constructed anywhere on the write path
+
+    Raises:
+        InvalidTTL: If the value is zero, negative, or not coercible.
+    """
+
+    if ttl_sec is None:
+        return default
+
+    if type(ttl_sec) is int:
+        if ttl_sec > 0:
+            return ttl_sec
+        raise InvalidTTL(ttl=ttl_sec)
+
+    try:
+        ttl = int(ttl_sec)
+    except (TypeError, ValueError):
+        raise InvalidTTL(ttl=ttl_sec) from None
+
+    if ttl <= 0:
+        raise InvalidTTL(ttl=ttl_sec)
+    return ttl
+
+
+@dataclass(slots=True, frozen=True)
 class QuickCacheConfig:
     """
     Configuration class for QuickCache.
@@ -36,6 +84,12 @@ class QuickCacheConfig:
     size limits, TTLs, storage options, serializer preferences, eviction policy,
     and metrics settings.
 
+    The config is frozen: settings are fixed for the lifetime of a cache,
+    and nothing in the package mutates one after construction. To derive a
+    variant, use `dataclasses.replace(config, field=...)`. Slots also drop
+    the per-instance __dict__, so reads like `config.max_size` on the hot
+    paths are fixed-offset loads.
+
     Attributes:
         max_size (int): Maximum number of items allowed in the cache.
         default_ttl (int): Default time-to-live (TTL) for cache entries in seconds.
@@ -48,6 +102,11 @@ class QuickCacheConfig:
         filename (str): Name of the file to store cache data. Default is 'cache_data'.
         cache_timestamps (bool): Whether to store timestamps for cache entries. Default is False.
 
+        thread_safe (bool): Whether to guard cache operations with a lock and run
+            the background cleanup thread. Default is True. Set to False for
+            single-threaded code (scripts, notebooks) to skip locking overhead;
+            expired entries must then be removed via manual cleanup() calls.
+
         enable_metrics (bool): Whether to enable metrics tracking. Default is True.
         metrics_serializer (str): Serializer for metrics data. Default is 'json'.
         metrics_storage_dir (str): Directory to store metrics files. Default is 'cache_metrics'.
@@ -61,13 +120,15 @@ class QuickCacheConfig:
 
     eviction_policy: str = "lru"
 
+    thread_safe: bool = True
+
     serializer: str = "pickle"
     storage_dir: str = "cache_storage"
     filename: str = "cache_data"
     cache_timestamps: bool = False
 
     enable_metrics: bool = True
-    metrics_serializer: bool = "json"
+    metrics_serializer: str = "json"
     metrics_storage_dir: str = "cache_metrics"
     metrics_filename: str = "metrics"
     cache_metrics_timestamps: bool = False
@@ -91,6 +152,34 @@ class QuickCache(BaseCache):
     library behavior.
     """
 
+    # Slots keep attribute access a fixed-offset load on every hot-path
+    # self.<attr> and drop the per-instance __dict__
+    __slots__ = (
+        "config",
+        "eviction_policy",
+        "serializer",
+        "_notify_on_add",
+        "_notify_on_update",
+        "_notify_on_access",
+        "_notify_on_delete",
+        "_lru_fastpath",
+        "_lockfree_hits",
+        "metrics",
+        "_metrics_enabled",
+        "_log_debug",
+        "metrics_serializer",
+        "cache_file_manager",
+        "cache_metrics_file_manager",
+        "cache",
+        "max_cache_size",
+        "_default_ttl",
+        "_earliest_expiration",
+        "_expiry_heap",
+        "_stop_event",
+        "_lock",
+        "cleanup_thread",
+    )
+
     def __init__(
         self,
         config: Optional[QuickCacheConfig] = None,
@@ -114,7 +203,45 @@ class QuickCache(BaseCache):
         self.eviction_policy = create_eviction_policy(self.config.eviction_policy)
         self.serializer = create_serializer(self.config.serializer)
 
+        # Cache which policy hooks actually do work, so hot paths can skip
+        # the method call for hooks the policy declares as no-ops.
+        noop_hooks = self.eviction_policy.NOOP_HOOKS
+        self._notify_on_add = "on_add" not in noop_hooks
+        self._notify_on_update = "on_update" not in noop_hooks
+        self._notify_on_access = "on_access" not in noop_hooks
+        self._notify_on_delete = "on_delete" not in noop_hooks
+
+        # The stock LRU policy's access/update hooks are just move_to_end on
+        # the cache dict. Detect that exact policy (not subclasses, which may
+        # override hooks) so hit paths can call the C-implemented
+        # OrderedDict.move_to_end directly instead of dispatching through a
+        # Python-level hook frame.
+        #
+        # An ordinal-counter "lazy" LRU (stamp entries on access, overgrow to
+        # 2x max_size, then bulk-evict by sorting ordinals) was considered as
+        # an alternative. It was rejected: size()/max_size is a documented,
+        # test-pinned invariant that overgrowth would break, and with
+        # move_to_end/popitem both running in C the per-hit cost here is
+        # already one C call — the ordinal stamp plus periodic nsmallest sort
+        # would not beat it under the GIL.
+        self._lru_fastpath = type(self.eviction_policy) is LRUEvictionPolicy
+
+        # When the policy keeps no access-order state (FIFO, no-op), a valid
+        # hit mutates nothing: dict.get is atomic under the GIL, the entry's
+        # deadline is one float compare, and the value can be returned
+        # without ever taking the lock. Missing and expired keys still fall
+        # through to the locked slow path, which is where mutation happens.
+        self._lockfree_hits = not self._notify_on_access and not self._lru_fastpath
+
         self.metrics = CacheMetrics() if self.config.enable_metrics else NoOpMetrics()
+        # Call-site guard: with metrics disabled the hot paths skip even the
+        # no-op method dispatch, not just the counter work.
+        self._metrics_enabled = self.config.enable_metrics
+
+        # Snapshot of the DEBUG level taken once at init; hot paths test this
+        # bool instead of formatting a message logging would drop anyway.
+        # (A log-level change after construction won't be picked up.)
+        self._log_debug = logger.isEnabledFor(logging.DEBUG)
         self.metrics_serializer = create_serializer(self.config.metrics_serializer)
 
         self.cache_file_manager = FileManager(
@@ -128,18 +255,62 @@ class QuickCache(BaseCache):
         )
 
         # In memory Cache
+        #
+        # Keys are stored as the caller's strings, hashed by CPython's
+        # SipHash. Pre-hashing long keys to xxh3 ints (with a collision
+        # side-table) was considered and rejected: str objects memoize
+        # their hash after the first computation, persistence and the
+        # eviction policies are keyed by the original strings, and the
+        # win only appears for multi-hundred-byte keys this cache does
+        # not target.
         self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self.max_cache_size = self.config.max_size
 
+        # Hoisted config reads for the write paths: one slot load instead of
+        # the self.config.<field> two-step on every set/add/update
+        self._default_ttl = self.config.default_ttl
+
+        # Earliest expiration across all entries; lets the background
+        # cleanup thread skip sweeps while nothing can have expired yet.
+        self._earliest_expiration = None
+
+        # Min-heap of (expiration_ts, key) pairs fed by the write paths, so
+        # cleanup() pops only entries that can actually be expired instead of
+        # scanning the whole cache. Updates leave stale pairs behind; the
+        # sweep detects them by comparing the heap deadline against the live
+        # entry's.
+        self._expiry_heap: "list[tuple[float, str]]" = []
+
         # The stop signal
         self._stop_event = threading.Event()
+
+        # In single-threaded mode a nullcontext stands in for the lock, so
+        # every `with self._lock:` block costs nothing. A plain Lock (not
+        # RLock) suffices: public entry points acquire exactly once and the
+        # internal helpers they call never reacquire.
+        #
+        # Sharding this lock (N stripes keyed by hash(key)) was considered
+        # and rejected: LRU/LFU recency is a single global ordering over one
+        # dict, the expiry heap and eviction-policy state are likewise
+        # global, so every stripe would still have to synchronize on shared
+        # structures for eviction — and under the GIL only one thread runs
+        # bytecode at a time anyway, so stripes buy contention relief only
+        # for the brief lock handoff, not parallelism.
+        if self.config.thread_safe:
+            self._lock = threading.Lock()
+        else:
+            self._lock = contextlib.nullcontext()
+
         # Start background cleanup thread (deamon=True to make sure it exits with main program)
-        self._lock: threading.RLock = threading.RLock()
-        # self._stop_event = threading.Event() # The "Stop Signal" in case our main program wants to exit
-        self.cleanup_thread = threading.Thread(
-            target=self._background_cleanup, daemon=True
-        )
-        self.cleanup_thread.start()
+        # Skipped in non-thread-safe mode: without a lock the sweeper cannot
+        # run concurrently, so expired entries rely on manual cleanup().
+        if self.config.thread_safe:
+            self.cleanup_thread = threading.Thread(
+                target=self._background_cleanup, daemon=True
+            )
+            self.cleanup_thread.start()
+        else:
+            self.cleanup_thread = None
 
         atexit.register(self.stop)
 
@@ -165,24 +336,47 @@ class QuickCache(BaseCache):
             KeyExpired: If the key exists but has expired.
         """
 
-        self.metrics.record_get()
+        metrics_enabled = self._metrics_enabled
+        if metrics_enabled:
+            self.metrics.record_get()
+
+        # Lock-free hit path for policies with no access bookkeeping: a
+        # valid hit is a pure read, so the lock acquire/release would buy
+        # nothing. Races are benign — at worst a concurrent delete or
+        # expiry linearizes just after this read returned the value.
+        if self._lockfree_hits:
+            entry = self.cache.get(key)
+            if entry is not None:
+                deadline = entry.expiration_ts
+                if deadline is None or monotonic() < deadline:
+                    if metrics_enabled:
+                        self.metrics.record_hit()
+                    return entry.value
+            # Missing or expired: the locked path below removes ghosts and
+            # records the miss
 
         with self._lock:
-            status = self._inspect_key(key)
+            status, entry = self._inspect_key(key)
 
-            if status is KeyStatus.MISSING:
-                self.metrics.record_miss()
+            if status == KEY_MISSING:
+                if metrics_enabled:
+                    self.metrics.record_miss()
                 raise KeyNotFound(key=key)
 
-            if status is KeyStatus.EXPIRED:
-                self.metrics.record_miss()
+            if status == KEY_EXPIRED:
+                if metrics_enabled:
+                    self.metrics.record_miss()
                 raise KeyExpired(key=key)
 
             # --- PLUGGABLE HOOK FOR EVICTION POLICY ---
-            self.eviction_policy.on_access(self.cache, key)
+            if self._lru_fastpath:
+                self.cache.move_to_end(key)
+            elif self._notify_on_access:
+                self.eviction_policy.on_access(self.cache, key)
 
-            self.metrics.record_hit()
-            return self.cache[key].value
+            if metrics_enabled:
+                self.metrics.record_hit()
+            return entry.value
 
     def set(self, key: str, value: Any, ttl_sec: int = None) -> None:
         """
@@ -200,17 +394,13 @@ class QuickCache(BaseCache):
             InvalidTTL: If the provided TTL is invalid.
         """
 
-        if ttl_sec is None:
-            ttl = self.config.default_ttl
-        elif self._is_ttl_valid(ttl_sec):
-            ttl = int(ttl_sec)
-        else:
-            raise InvalidTTL(ttl=ttl_sec)
+        ttl = _resolve_ttl(ttl_sec, self._default_ttl)
 
         with self._lock:
             self._internal_set(key, value, ttl)
 
-            logger.debug(f"Key '{key}' set.")
+            if self._log_debug:
+                logger.debug("Key '%s' set.", key)
 
     def add(self, key: str, value: Any, ttl_sec: int = None) -> None:
         """
@@ -227,47 +417,52 @@ class QuickCache(BaseCache):
             InvalidTTL: If the provided TTL is invalid.
         """
 
-        with self._lock:
+        ttl = _resolve_ttl(ttl_sec, self._default_ttl)
 
-            if ttl_sec is None:
-                ttl = self.config.default_ttl
-            elif self._is_ttl_valid(ttl=ttl_sec) is True:
-                ttl = int(ttl_sec)
-            else:
-                raise InvalidTTL(ttl=ttl_sec)
-
-            status = self._inspect_key(key=key)
+        with self._lock:
+            status, _ = self._inspect_key(key)
 
-            if status is KeyStatus.VALID:
-                self.metrics.record_failed_op()
+            if status == KEY_VALID:
+                if self._metrics_enabled:
+                    self.metrics.record_failed_op()
                 raise KeyAlreadyExists(key=key)
 
             # status is MISSING or EXPIRED → allowed to add
-            if self.size() >= self.max_cache_size:
+            if len(self.cache) >= self.max_cache_size:
                 self._ensure_capacity()
 
             # Add a new cache entry as no valid key exists
+            expiration = monotonic() + ttl
             self.cache[key] = CacheEntry(
                 value=value,
-                expiration_time=utcnow() + timedelta(seconds=ttl),
+                expiration_ts=expiration,
                 ttl=ttl,
             )
+            heapq.heappush(self._expiry_heap, (expiration, key))
+            self._track_expiration(expiration)
+            self._maybe_compact_expiry_heap()
 
-            logger.debug(f"Key '{key}' added.")
+            if self._log_debug:
+                logger.debug("Key '%s' added.", key)
 
             # SYNC THE METRICS
             # Record a successful set operation and update the total keys as well as valid keys since we know one more valid key is added
-            self.metrics.record_set()
-            self.metrics.update_total_keys(self.size())
-            self.metrics.update_valid_keys_by_delta(delta=1)
+            if self._metrics_enabled:
+                self.metrics.record_set()
+                self.metrics.update_total_keys(len(self.cache))
+                self.metrics.update_valid_keys_by_delta(delta=1)
 
             # --- PLUGGABLE HOOK FOR EVICTION POLICY ---
-            self.eviction_policy.on_add(self.cache, key)
+            if self._notify_on_add:
+                self.eviction_policy.on_add(self.cache, key)
 
     def update(self, key: str, value: Any, ttl_sec: int = None) -> None:
         """
         Update the value of an existing valid key.
 
+        The existing CacheEntry is mutated in place (slot writes) rather
+        than replaced, so an update allocates nothing.
+
         Args:
             key (str): The cache key.
             value (Any): The new value.
@@ -279,42 +474,45 @@ class QuickCache(BaseCache):
             InvalidTTL: If the provided TTL is invalid.
         """
 
-        with self._lock:
+        ttl = _resolve_ttl(ttl_sec, self._default_ttl)
 
-            if ttl_sec is None:
-                ttl = self.config.default_ttl
-            elif self._is_ttl_valid(ttl=ttl_sec) is True:
-                ttl = int(ttl_sec)
-            else:
-                raise InvalidTTL(ttl=ttl_sec)
-
-            status = self._inspect_key(key=key)
+        with self._lock:
+            status, entry = self._inspect_key(key)
 
-            if status is KeyStatus.MISSING:
-                self.metrics.record_failed_op()
+            if status == KEY_MISSING:
+                if self._metrics_enabled:
+                    self.metrics.record_failed_op()
                 raise KeyNotFound(key=key)
 
-            if status is KeyStatus.EXPIRED:
-                self.metrics.record_failed_op()
+            if status == KEY_EXPIRED:
+                if self._metrics_enabled:
+                    self.metrics.record_failed_op()
                 raise KeyExpired(key=key)
 
-            # Perform the update, as a valid key is present
-            self.cache[key] = CacheEntry(
-                value=value,
-                expiration_time=utcnow() + timedelta(seconds=ttl),
-                ttl=ttl,
-            )
+            # Perform the update in place, as a valid key is present
+            expiration = monotonic() + ttl
+            entry.value = value
+            entry.expiration_ts = expiration
+            entry.ttl = ttl
+            heapq.heappush(self._expiry_heap, (expiration, key))
+            self._track_expiration(expiration)
+            self._maybe_compact_expiry_heap()
 
-            logger.debug(f"Key '{key}' updated.")
+            if self._log_debug:
+                logger.debug("Key '%s' updated.", key)
 
             # --- PLUGGABLE HOOK FOR EVICTION POLICY ---
-            self.eviction_policy.on_update(self.cache, key)
+            if self._lru_fastpath:
+                self.cache.move_to_end(key)
+            elif self._notify_on_update:
+                self.eviction_policy.on_update(self.cache, key)
 
             # SYNC THE METRICS
             # Record a successful set and update the total and valid keys
-            self.metrics.record_set()
-            self.metrics.update_total_keys(self.size())
-            # self.metrics.update_valid_keys_by_delta(delta=0)
+            if self._metrics_enabled:
+                self.metrics.record_set()
+                self.metrics.update_total_keys(len(self.cache))
+                # update_valid_keys_by_delta(delta=0) would be a no-op
 
     def delete(self, key: str) -> None:
         """
@@ -329,29 +527,34 @@ class QuickCache(BaseCache):
         """
 
         with self._lock:
-            status = self._inspect_key(key=key)
+            status, _ = self._inspect_key(key)
 
-            if status is KeyStatus.MISSING:
-                self.metrics.record_miss()
+            if status == KEY_MISSING:
+                if self._metrics_enabled:
+                    self.metrics.record_miss()
                 raise KeyNotFound(key=key)
 
-            if status is KeyStatus.EXPIRED:
-                self.metrics.record_miss()
+            if status == KEY_EXPIRED:
+                if self._metrics_enabled:
+                    self.metrics.record_miss()
                 raise KeyExpired(key=key)
 
             # Delete the valid key
             self.cache.pop(key)
 
             # Eviction Policy Hook
-            self.eviction_policy.on_delete(self.cache, key)
+            if self._notify_on_delete:
+                self.eviction_policy.on_delete(self.cache, key)
 
-            logger.debug(f"Key '{key}' manually deleted.")
+            if self._log_debug:
+                logger.debug("Key '%s' manually deleted.", key)
 
             # SYNC THE METRICS
             # Record manual deletion, and update the total and valid keys accordingly
-            self.metrics.record_manual_deletion()
-            self.metrics.update_total_keys(self.size())
-            self.metrics.update_valid_keys_by_delta(delta=-1)
+            if self._metrics_enabled:
+                self.metrics.record_manual_deletion()
+                self.metrics.update_total_keys(len(self.cache))
+                self.metrics.update_valid_keys_by_delta(delta=-1)
 
     def set_many(self, data: dict[str, Any], ttl_sec: int = None) -> None:
         """
@@ -368,17 +571,92 @@ class QuickCache(BaseCache):
             InvalidTTL: If the provided TTL is invalid.
         """
 
-        if ttl_sec is None:
-            ttl = self.config.default_ttl
-        elif self._is_ttl_valid(ttl=ttl_sec) is True:
-            ttl = int(ttl_sec)
-        else:
-            raise InvalidTTL(ttl=ttl_sec)
+        ttl = _resolve_ttl(ttl_sec, self._default_ttl)
 
         with self._lock:
+            # Specialized bulk body: one shared deadline, one expiry-status
+            # check per key inline (no _inspect_key dispatch), and a single
+            # heap merge plus metrics flush for the whole batch
+            cache = self.cache
+            max_size = self.max_cache_size
+            deadline = monotonic() + ttl
+            now = deadline - ttl
+            lru_fastpath = self._lru_fastpath
+            policy = self.eviction_policy
+            on_add = policy.on_add if self._notify_on_add else None
+            on_update = policy.on_update if self._notify_on_update else None
+            on_delete = policy.on_delete if self._notify_on_delete else None
+
+            metrics_enabled = self._metrics_enabled
+            expired_removed = 0
+
+            # Net change in valid keys not yet pushed to the metrics. Must
+            # be flushed before _ensure_capacity runs: eviction resets the
+            # valid count absolutely via update_sizes, so any delta still
+            # pending at that point would be applied twice afterwards.
+            pending_valid_delta = 0
+
             for key, value in data.items():
-                # We use the internal method that doesn't care about missing or expired keys
-                self._internal_set(key, value, ttl)
+                entry = cache.get(key)
+
+                if entry is not None:
+                    entry_deadline = entry.expiration_ts
+                    if entry_deadline is None or entry_deadline > now:
+                        # Valid key: mutate in place
+                        entry.value = value
+                        entry.expiration_ts = deadline
+                        entry.ttl = ttl
+                        if lru_fastpath:
+                            cache.move_to_end(key)
+                        elif on_update is not None:
+                            on_update(cache, key)
+                        continue
+
+                    # Expired ghost: drop it before re-inserting
+                    cache.pop(key)
+                    expired_removed += 1
+                    pending_valid_delta -= 1
+                    if on_delete is not None:
+                        on_delete(cache, key)
+
+                if len(cache) >= max_size:
+                    if metrics_enabled and pending_valid_delta:
+                        self.metrics.update_valid_keys_by_delta(pending_valid_delta)
+                        pending_valid_delta = 0
+                    self._ensure_capacity()
+
+                cache[key] = CacheEntry(value=value, expiration_ts=deadline, ttl=ttl)
+                pending_valid_delta += 1
+                if on_add is not None:
+                    on_add(cache, key)
+
+            if data:
+                # One heap pair covers each batch key: every written entry
+                # shares the same deadline, and a single (deadline, key) pair
+                # per batch key keeps the sweep's stale-pair check working.
+                # A small batch against a big standing heap is merged with
+                # per-key pushes (O(m log n)); re-heapifying the whole heap
+                # (O(n + m)) only pays off once the batch is a sizeable
+                # fraction of it.
+                heap = self._expiry_heap
+                if len(data) * 10 < len(heap):
+                    heappush = heapq.heappush
+                    for key in data:
+                        heappush(heap, (deadline, key))
+                else:
+                    heap.extend((deadline, key) for key in data)
+                    heapq.heapify(heap)
+                self._track_expiration(deadline)
+                self._maybe_compact_expiry_heap()
+
+            # Flush metrics once for the whole batch instead of per key
+            if metrics_enabled:
+                self.metrics.record_sets(len(data))
+                if expired_removed:
+                    self.metrics.record_expired_removals(expired_removed)
+                if pending_valid_delta:
+                    self.metrics.update_valid_keys_by_delta(pending_valid_delta)
+                self.metrics.update_total_keys(len(self.cache))
 
     def get_many(self, keys: list[str]) -> dict[str, Any]:
         """
@@ -396,19 +674,34 @@ class QuickCache(BaseCache):
 
         with self._lock:
             # Record only the overall bulk operation
-            self.metrics.record_get()
+            if self._metrics_enabled:
+                self.metrics.record_get()
+
+            # Bind loop invariants once; LOAD_FAST beats repeated attribute
+            # resolution when the key list is large
+            inspect = self._inspect_key
+            move_to_end = self.cache.move_to_end if self._lru_fastpath else None
+            misses = 0
 
             for key in keys:
-                status = self._inspect_key(key=key)
+                status, entry = inspect(key)
 
-                if status is KeyStatus.VALID:
-                    results[key] = self.cache[key].value
-                    self.metrics.record_hit()
-                    # Eviction policy hook
-                    self.eviction_policy.on_access(self.cache, key)
+                if status == KEY_VALID:
+                    results[key] = entry.value
+                    if move_to_end is not None:
+                        move_to_end(key)
                 else:
-                    # Missing or expired keys: record a miss
-                    self.metrics.record_miss()
+                    # Missing or expired keys tally as misses
+                    misses += 1
+
+            # Flush the tallies once instead of one metrics call per key
+            if results:
+                if self._metrics_enabled:
+                    self.metrics.record_hits(len(results))
+                if move_to_end is None and self._notify_on_access:
+                    self.eviction_policy.on_access_many(self.cache, list(results))
+            if misses and self._metrics_enabled:
+                self.metrics.record_misses(misses)
 
         return results
 
@@ -426,26 +719,38 @@ class QuickCache(BaseCache):
         with self._lock:
 
             skipped_keys = []
+            deleted = 0
+
+            # Same local-binding treatment as get_many
+            cache = self.cache
+            inspect = self._inspect_key
+            on_delete = (
+                self.eviction_policy.on_delete if self._notify_on_delete else None
+            )
 
             for key in keys:
-                status = self._inspect_key(key=key)
-                if status is KeyStatus.VALID:
-                    self.cache.pop(key=key)
-                    logger.debug(f"Key '{key}' deleted in bulk operation.")
+                status, _ = inspect(key)
+                if status == KEY_VALID:
+                    cache.pop(key)
+                    deleted += 1
+                    if self._log_debug:
+                        logger.debug("Key '%s' deleted in bulk operation.", key)
 
                     # Eviction Policy Hook
-                    self.eviction_policy.on_delete(self.cache, key)
-
-                    # Record metrics
-                    self.metrics.record_manual_deletion()
-                    self.metrics.update_valid_keys_by_delta(-1)
+                    if on_delete is not None:
+                        on_delete(cache, key)
 
                 else:
                     skipped_keys.append(key)
-                    self.metrics.record_miss()
 
-            # Record metrics: update the total count
-            self.metrics.update_total_keys(self.size())
+            # Record metrics: flush the tallies in one call each
+            if self._metrics_enabled:
+                if deleted:
+                    self.metrics.record_manual_deletions(count=deleted)
+                    self.metrics.update_valid_keys_by_delta(-deleted)
+                if skipped_keys:
+                    self.metrics.record_misses(len(skipped_keys))
+                self.metrics.update_total_keys(len(self.cache))
 
             if skipped_keys:
                 logger.warning(
@@ -457,12 +762,15 @@ class QuickCache(BaseCache):
         Return the total number of entries in the cache,
         including expired entries.
 
+        Reads the dict length without taking the lock: len() on a dict is
+        a single C-level read that can't observe a torn state, so under
+        concurrent writers the value is merely momentarily stale.
+
         Returns:
             int: Total cache size.
         """
 
-        with self._lock:
-            return len(self.cache)
+        return len(self.cache)
 
     def valid_size(self) -> int:
         """
@@ -475,7 +783,7 @@ class QuickCache(BaseCache):
         """
 
         with self._lock:
-            self.cleanup()
+            self._cleanup_locked()
             return len(self.cache)
 
     def clear(self) -> None:
@@ -489,11 +797,13 @@ class QuickCache(BaseCache):
         with self._lock:
             cleared_count = len(self.cache)
             self.cache.clear()
+            self._expiry_heap.clear()
+            self._earliest_expiration = None
 
             # Reset the dynamic metric counters
-            self.metrics.update_total_keys(0)
-            self.metrics.update_valid_keys(0)
-            self.metrics.record_manual_deletions(count=cleared_count)
+            if self._metrics_enabled:
+                self.metrics.update_sizes(0, 0)
+                self.metrics.record_manual_deletions(count=cleared_count)
 
             logger.info(f"Cache cleared. Removed {cleared_count} items.")
 
@@ -503,25 +813,65 @@ class QuickCache(BaseCache):
         synchronize cache metrics.
         """
 
+        with self._lock:
+            self._cleanup_locked()
+
+    def _cleanup_locked(self) -> None:
+        """
+        INTERNAL.
+
+        Sweep expired entries; the caller must already hold the lock.
+
+        Purpose:
+            Shared body for cleanup(), valid_size(), and _ensure_capacity(),
+            so none of them reacquires the (non-reentrant) lock.
+        """
+
         removed_count = 0
 
-        with self._lock:
+        cache = self.cache
+        heap = self._expiry_heap
+        heappop = heapq.heappop
+        now = monotonic()
+        on_delete = self.eviction_policy.on_delete if self._notify_on_delete else None
+        record_expired_removal = (
+            self.metrics.record_expired_removal if self._metrics_enabled else None
+        )
 
-            # Perform the sweep
-            for key in list(self.cache.keys()):
-                # This helper handles the deletion and the 'expired_removal' count
-                status = self._inspect_key(key=key)
-                if status is KeyStatus.EXPIRED:
-                    removed_count = removed_count + 1
+        # Pop deadlines that have passed; everything deeper in the heap
+        # is still in the future, so the sweep is O(expired), not O(N)
+        while heap and heap[0][0] <= now:
+            deadline, key = heappop(heap)
+            entry = cache.get(key)
 
-            final_count = self.size()
+            # Stale pair: the key was deleted, evicted, or re-written
+            # with a newer deadline since this pair was pushed
+            if entry is None or entry.expiration_ts != deadline:
+                continue
 
-            # SYNC THE METRICS
-            # After a full sweep, physical length and valid size are identical.
-            self.metrics.update_total_keys(final_count)  # Total Length
-            self.metrics.update_valid_keys(final_count)  # Valid Size
+            cache.pop(key)
+            removed_count += 1
+
+            # Eviction Policy Hook
+            if on_delete is not None:
+                on_delete(cache, key)
+
+            if record_expired_removal is not None:
+                record_expired_removal()
 
-            # logger.debug(f"Cleanup finished. Removed {removed_count} expired items.")
+        final_count = len(cache)
+
+        # The next live deadline is at worst the heap top (stale pairs
+        # only make the background thread wake early, never late)
+        self._earliest_expiration = heap[0][0] if heap else None
+
+        # SYNC THE METRICS
+        # After a full sweep, physical length and valid size are identical.
+        if self._metrics_enabled:
+            # Total length and valid size are identical here; one fused call
+            self.metrics.update_sizes(final_count, final_count)
+
+        # logger.debug(f"Cleanup finished. Removed {removed_count} expired items.")
 
     def stop(self) -> None:
         """
@@ -535,6 +885,10 @@ class QuickCache(BaseCache):
             logger.info("Stopping InMemoryCache...")
             self._stop_event.set()
 
+            if self.cleanup_thread is None:
+                # Non-thread-safe mode never started the sweeper
+                return
+
             # Wait up to 2 seconds for the thread to wrap up
             self.cleanup_thread.join(timeout=2.0)
 
@@ -562,7 +916,7 @@ class QuickCache(BaseCache):
         )
 
         with self._lock:
-            if not self.serializer.is_binary:
+            if not self.serializer.serializes_objects:
                 data_to_serialize = {k: v.to_dict() for k, v in self.cache.items()}
             else:
                 data_to_serialize = self.cache
@@ -614,22 +968,30 @@ class QuickCache(BaseCache):
             loaded_data = self.serializer.deserialize(serialized_data)
 
             with self._lock:
-                if not self.serializer.is_binary:
-                    # We have to do this, because non binary serializers cannot serialize datetime properly and they are being handled from_dict() func
-                    new_cache = OrderedDict()
-                    for k, v in loaded_data.items():
-                        entry = CacheEntry.from_dict(v)
-                        if entry is not None:
-                            new_cache[k] = entry
-                    self.cache = new_cache
+                if not self.serializer.serializes_objects:
+                    # Dict-shaped formats (json, msgpack) store plain dicts;
+                    # rebuild the entries in one dict-build expression
+                    from_dict = CacheEntry.from_dict
+                    self.cache = OrderedDict(
+                        (k, from_dict(v)) for k, v in loaded_data.items()
+                    )
                 else:
                     self.cache = loaded_data
 
+                self._expiry_heap = [
+                    (entry.expiration_ts, key)
+                    for key, entry in self.cache.items()
+                    if entry.expiration_ts is not None
+                ]
+                heapq.heapify(self._expiry_heap)
+                self._earliest_expiration = (
+                    self._expiry_heap[0][0] if self._expiry_heap else None
+                )
+
                 # Sync physical metrics only
                 total = len(self.cache)
                 self.metrics.reset()
-                self.metrics.update_total_keys(total)
-                self.metrics.update_valid_keys(total)
+                self.metrics.update_sizes(total, total)
 
         except Exception as e:
             raise CacheLoadError(filepath, e) from e
@@ -694,38 +1056,7 @@ class QuickCache(BaseCache):
         except Exception as e:
             raise CacheMetricsSaveError(filepath or "unknown", e) from e
 
-    def _is_ttl_valid(self, ttl: int) -> bool:
-        """
-        INTERNAL.
-
-        Validate a TTL value.
-
-        Purpose:
-            Ensures that a TTL is a positive integer before it is used
-            to compute expiration timestamps.
-
-        Behavior:
-            - Returns False for None, zero, negative, or non-integer values
-            - Does not raise; validation errors are handled by the caller
-
-        Returns:
-            bool: True if TTL is valid, False otherwise.
-        """
-
-        if not ttl:
-            return False
-
-        try:
-            ttl = int(ttl)
-        except ValueError:
-            return False
-
-        if ttl <= 0:
-            return False
-
-        return True
-
-    def _inspect_key(self, key: str) -> KeyStatus:
+    def _inspect_key(self, key: str) -> "tuple[int, Optional[CacheEntry]]":
         """
         INTERNAL.
 
@@ -747,34 +1078,42 @@ class QuickCache(BaseCache):
             (expired keys are removed on first inspection)
 
         Returns:
-            KeyStatus: MISSING, EXPIRED, or VALID
+            tuple[int, Optional[CacheEntry]]: One of the KEY_MISSING /
+            KEY_EXPIRED / KEY_VALID constants, plus the entry itself when
+            valid (None otherwise) so hit paths don't need a second dict
+            lookup. Bare ints rather than KeyStatus members keep the
+            per-call comparisons to a constant compare.
         """
 
         entry = self.cache.get(key)
 
         if entry is None:
-            return KeyStatus.MISSING
+            return KEY_MISSING, None
 
         if entry.is_expired():
             self.cache.pop(key)
 
             # Eviction Policy Hook
-            self.eviction_policy.on_delete(self.cache, key)
+            if self._notify_on_delete:
+                self.eviction_policy.on_delete(self.cache, key)
 
             # SYNC THE METRICS
             # After a deletion, we need to update the 'expired_removals' count and the total keys
             # We will also update the valid keys metric since we dont know if the background cleanup had caught onto or not
             # If we don't decrement it there, your current_valid_keys will stay artificially high until the next full cleanup() runs
 
-            self.metrics.record_expired_removal()
-            self.metrics.update_total_keys(len(self.cache))
-            self.metrics.update_valid_keys_by_delta(-1)
+            if self._metrics_enabled:
+                self.metrics.record_expired_removal()
+                self.metrics.update_total_keys(len(self.cache))
+                self.metrics.update_valid_keys_by_delta(-1)
 
-            return KeyStatus.EXPIRED
+            return KEY_EXPIRED, None
 
-        return KeyStatus.VALID
+        return KEY_VALID, entry
 
-    def _internal_set(self, key: str, value: Any, ttl: int) -> None:
+    def _internal_set(
+        self, key: str, value: Any, ttl: int, record_metrics: bool = True
+    ) -> bool:
         """
         INTERNAL.
 
@@ -795,45 +1134,122 @@ class QuickCache(BaseCache):
             - Assumes TTL has already been validated
             - Mutates cache, eviction policy state, and metrics
             - Should only be called from methods holding the cache lock
+            - With record_metrics=False the set/size metrics are left to the
+              caller, so bulk operations can flush one tally for the batch
+
+        Returns:
+            bool: True if the write created a new entry (the key was missing
+            or expired), False if it updated a valid one.
 
         Notes:
             This method exists to avoid duplicating complex logic across
             set(), add(), update(), and set_many().
         """
 
-        status = self._inspect_key(key)
+        status, entry = self._inspect_key(key)
 
-        is_new = status is KeyStatus.MISSING
-        is_ghost = status is KeyStatus.EXPIRED
+        is_new = status == KEY_MISSING
+        is_ghost = status == KEY_EXPIRED
 
         # ENFORCE CAPACITY
-        if (is_new or is_ghost) and self.size() >= self.max_cache_size:
+        if (is_new or is_ghost) and len(self.cache) >= self.max_cache_size:
             self._ensure_capacity()
 
-        expiration = utcnow() + timedelta(seconds=ttl)
-        self.cache[key] = CacheEntry(value=value, expiration_time=expiration, ttl=ttl)
+        expiration = monotonic() + ttl
 
-        # HOOK FOR EVICTION POLICY
         if is_new or is_ghost:
-            self.eviction_policy.on_add(self.cache, key)
+            self.cache[key] = CacheEntry(value=value, expiration_ts=expiration, ttl=ttl)
         else:
+            # Existing valid key: mutate the slots dataclass in place and
+            # save the allocation + old-entry decref on the hot update path
+            entry.value = value
+            entry.expiration_ts = expiration
+            entry.ttl = ttl
+
+        heapq.heappush(self._expiry_heap, (expiration, key))
+        self._track_expiration(expiration)
+        self._maybe_compact_expiry_heap()
+
+        # HOOK FOR EVICTION POLICY
+        if self._lru_fastpath:
+            # Fresh inserts already land at the end of the dict; only a
+            # valid-key update needs an explicit move
+            if not (is_new or is_ghost):
+                self.cache.move_to_end(key)
+        elif is_new or is_ghost:
+            if self._notify_on_add:
+                self.eviction_policy.on_add(self.cache, key)
+        elif self._notify_on_update:
             self.eviction_policy.on_update(self.cache, key)
 
         # RECORD METRICS
-        self.metrics.record_set()
-
-        if is_new:
-            self.metrics.update_total_keys(len(self.cache))
-            self.metrics.update_valid_keys_by_delta(1)
-        elif is_ghost:
-            # Since the ghost was removed by the helper, total_keys count
-            # is already updated inside _inspect_key.
-            # We just need to sync the new total and increment valid count.
-            self.metrics.update_total_keys(len(self.cache))
-            self.metrics.update_valid_keys_by_delta(1)
-        else:
-            # It was a valid update to an existing key - sizes don't change!
-            pass
+        if record_metrics and self._metrics_enabled:
+            self.metrics.record_set()
+
+            if is_new or is_ghost:
+                # For ghosts, _inspect_key already removed the stale entry
+                # and adjusted total_keys; sync the new total and increment
+                # the valid count either way.
+                self.metrics.update_total_keys(len(self.cache))
+                self.metrics.update_valid_keys_by_delta(1)
+            # A valid update to an existing key leaves sizes unchanged
+
+        return is_new or is_ghost
+
+    def _track_expiration(self, expiration) -> None:
+        """
+        INTERNAL.
+
+        Record a newly written entry's expiration deadline if it is the
+        earliest one known.
+
+        Purpose:
+            Keeps `_earliest_expiration` accurate on the write path so the
+            background cleanup thread can tell whether a sweep could remove
+            anything at all.
+
+        Important:
+            - Deletions may leave the tracked value stale (too early);
+              that only costs one wasted sweep, never a missed one.
+            - Must be called while holding the cache lock.
+        """
+
+        earliest = self._earliest_expiration
+        if earliest is None or expiration < earliest:
+            self._earliest_expiration = expiration
+
+    def _maybe_compact_expiry_heap(self) -> None:
+        """
+        INTERNAL.
+
+        Rebuild the expiry heap from live entries when stale pairs dominate.
+
+        Purpose:
+            Every rewrite of a key pushes a fresh (deadline, key) pair and
+            leaves the old one in the heap until its deadline passes; a hot
+            key rewritten with a long TTL can therefore pin thousands of
+            stale pairs for a cache holding one entry. When the heap grows
+            past twice the number of live entries (and past a small floor
+            where rebuilds are not worth the churn), rebuild it from the
+            entries themselves — O(live) work that bounds heap memory at
+            a constant factor of the cache size.
+
+        Important:
+            Must be called while holding the cache lock.
+        """
+
+        heap = self._expiry_heap
+        if len(heap) <= _HEAP_COMPACT_MIN or len(heap) <= 2 * len(self.cache):
+            return
+
+        heap = [
+            (entry.expiration_ts, key)
+            for key, entry in self.cache.items()
+            if entry.expiration_ts is not None
+        ]
+        heapq.heapify(heap)
+        self._expiry_heap = heap
+        self._earliest_expiration = heap[0][0] if heap else None
 
     def _ensure_capacity(self) -> None:
         """
@@ -863,51 +1279,92 @@ class QuickCache(BaseCache):
             f"Cache capacity ({self.max_cache_size}) reached. Evicting items."
         )
 
-        self.cleanup()
+        self._cleanup_locked()
 
-        eviction_happened = False
+        cache = self.cache
+        policy = self.eviction_policy
+        max_size = self.max_cache_size
+        on_delete = policy.on_delete if self._notify_on_delete else None
 
-        while self.size() >= self.max_cache_size:
-            evicted_key = self.eviction_policy.select_eviction_key(self.cache)
-            self.cache.pop(evicted_key)
-            # Eviction Policy Hook
-            self.eviction_policy.on_delete(self.cache, evicted_key)
-            # Record Metrics
-            self.metrics.record_eviction()
-            eviction_happened = True
+        evicted = 0
 
-        if eviction_happened:
-            new_size = self.size()
-            self.metrics.update_total_keys(new_size)
-            self.metrics.update_valid_keys(new_size)
+        if self._lru_fastpath:
+            # Stock LRU keeps no per-key state and declares on_delete a
+            # no-op, so an insert storm drains victims with bare popitem
+            # calls and no policy dispatch at all
+            popitem = cache.popitem
+            while len(cache) >= max_size:
+                popitem(last=False)
+                evicted += 1
+        else:
+            while len(cache) >= max_size:
+                popped = policy.pop_eviction_key(cache)
+                if popped is not None:
+                    # Combined select + pop (single OrderedDict operation)
+                    evicted_key = popped[0]
+                else:
+                    # Policy needs a scan (e.g. LFU): select first, then pop
+                    evicted_key = policy.select_eviction_key(cache)
+                    cache.pop(evicted_key)
+                # Eviction Policy Hook
+                if on_delete is not None:
+                    on_delete(cache, evicted_key)
+                evicted += 1
+
+        # Record Metrics: one flush for the whole batch
+        if evicted and self._metrics_enabled:
+            self.metrics.record_evictions(evicted)
+            new_size = len(cache)
+            self.metrics.update_sizes(new_size, new_size)
 
     def _background_cleanup(self) -> None:
         """
         INTERNAL.
 
-        Debug-only helper for inspecting cache contents.
+        Background thread loop that removes expired entries periodically.
 
         Purpose:
-            Prints the current in-memory cache state in a human-readable format.
+            Keeps the cache free of expired entries without blocking callers.
 
         Behavior:
-            - Forces a cleanup pass before printing
-            - Acquires the cache lock
-            - Writes directly to stdout
+            - Sleeps on Event.wait until the earliest tracked expiration
+              (capped at the configured cleanup interval), instead of a
+              fixed-period poll
+            - Skips the sweep entirely when no entry can have expired yet,
+              so an idle cache costs no lock acquisitions
+            - When it does sweep, the expiry heap keeps the critical section
+              O(expired), so concurrent get/set never stall behind a
+              full-cache scan
+            - Wakes up instantly when the stop event is set
 
         Important:
-            - Not part of the public API
-            - Should not be used in production code
+            - Reads `_earliest_expiration` without the lock; a stale value
+              only causes one wasted or slightly early wakeup
         """
 
         logger.info("Background cleanup thread started.")
+        # The config is frozen, so the interval can be read once instead of
+        # chasing self.config on every wakeup
+        interval = self.config.cleanup_interval
         # Loop as long as the stop signal hasn't been set
         try:
             while not self._stop_event.is_set():
-                # Wait for the interval, but wake up instantly if stop_event is set
-                if self._stop_event.wait(timeout=self.config.cleanup_interval):
+                earliest = self._earliest_expiration
+                if earliest is not None:
+                    until_expiry = earliest - monotonic()
+                    timeout = min(interval, max(0.0, until_expiry))
+                else:
+                    timeout = interval
+
+                # Wait for the computed delay, but wake up instantly if stop_event is set
+                if self._stop_event.wait(timeout=timeout):
                     break  # Exit loop if wait returned True (event was set)
 
+                earliest = self._earliest_expiration
+                if earliest is None or monotonic() < earliest:
+                    # Nothing can have expired since the last sweep
+                    continue
+
                 logger.debug("Periodic cleanup sweep triggered.")
                 self.cleanup()
         except Exception as e:
@@ -939,9 +1396,15 @@ class QuickCache(BaseCache):
 
         with self._lock:
 
-            self.cleanup()
+            self._cleanup_locked()
 
-            print(f"\n\tIn Memory Cache\n")
-            for key in list(self.cache.keys()):
-                print(f"\t\t{key} : {self.cache[key].value} : {self.cache[key].ttl}\n")
-            print(f"\tEND\n")
+            # Build the whole dump in memory and flush it with one write:
+            # a print() per entry would take the stdout lock and issue a
+            # syscall per line, all while self._lock is held
+            buf = ["\n\tIn Memory Cache\n\n"]
+            buf.extend(
+                f"\t\t{key} : {entry.value} : {entry.ttl}\n\n"
+                for key, entry in self.cache.items()
+            )
+            buf.append("\tEND\n\n")
+            sys.stdout.write("".join(buf))
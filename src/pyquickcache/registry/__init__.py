@@ -1,3 +1,15 @@
 from .registry import create_eviction_policy, create_serializer, create_cache_backend
+from .decorators import (
+    register_cache_backend,
+    register_eviction_policy,
+    register_serializer,
+)
 
-__all__ = ["create_eviction_policy", "create_serializer", "create_cache_backend"]
+__all__ = [
+    "create_eviction_policy",
+    "create_serializer",
+    "create_cache_backend",
+    "register_cache_backend",
+    "register_eviction_policy",
+    "register_serializer",
+]
@@ -5,6 +5,13 @@ if TYPE_CHECKING:
     from ..eviction_policy.base import BaseEvictionPolicy
     from ..serializer.base import BaseSerializer
 
+# Lazily resolved base classes, keyed by component kind. The runtime
+# imports inside the decorators exist to break circular imports, but each
+# registration would otherwise re-enter the import machinery (sys.modules
+# lookup plus attribute resolution); the first resolution is cached here so
+# registering many plugins pays the import walk once per base.
+_base_cache: dict = {}
+
 
 def register_cache_backend(name: str):
     """
@@ -24,11 +31,16 @@ def register_cache_backend(name: str):
         Uses runtime import to avoid circular dependencies.
     """
 
-    from ..backend import BaseCacheBackend
     from .registry import _register_cache_backend as _register
 
+    base = _base_cache.get("backend")
+    if base is None:
+        from ..backend import BaseCacheBackend
+
+        base = _base_cache["backend"] = BaseCacheBackend
+
     def decorator(cls: Type["BaseCacheBackend"]) -> Type["BaseCacheBackend"]:
-        if not issubclass(cls, BaseCacheBackend):
+        if not issubclass(cls, base):
             raise TypeError(
                 f"Cache backend must inherit from BaseCacheBackend, got {cls.__name__}"
             )
@@ -57,11 +69,16 @@ def register_eviction_policy(name: str):
         Uses runtime import to avoid circular dependencies.
     """
 
-    from ..eviction_policy.base import BaseEvictionPolicy
     from .registry import _register_eviction_policy as _register
 
+    base = _base_cache.get("eviction_policy")
+    if base is None:
+        from ..eviction_policy.base import BaseEvictionPolicy
+
+        base = _base_cache["eviction_policy"] = BaseEvictionPolicy
+
     def decorator(cls: Type["BaseEvictionPolicy"]) -> Type["BaseEvictionPolicy"]:
-        if not issubclass(cls, BaseEvictionPolicy):
+        if not issubclass(cls, base):
             raise TypeError(
                 f"Eviction policy must inherit from BaseEvictionPolicy, got {cls.__name__}"
             )
@@ -90,11 +107,16 @@ def register_serializer(name: str):
         Uses runtime import to avoid circular dependencies.
     """
 
-    from ..serializer.base import BaseSerializer
     from .registry import _register_serializer as _register
 
+    base = _base_cache.get("serializer")
+    if base is None:
+        from ..serializer.base import BaseSerializer
+
+        base = _base_cache["serializer"] = BaseSerializer
+
     def decorator(cls: Type["BaseSerializer"]) -> Type["BaseSerializer"]:
-        if not issubclass(cls, BaseSerializer):
+        if not issubclass(cls, base):
             raise TypeError(
                 f"Serializer must inherit from BaseSerializer, got {cls.__name__}"
             )
@@ -16,6 +16,7 @@ case-insensitive lookups.
 
 from __future__ import annotations
 
+import functools
 from typing import Type, Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -53,6 +54,7 @@ def _register_cache_backend(name: str, cls: Type[BaseCacheBackend]) -> None:
     if key in _CACHE_BACKEND_REGISTRY:
         raise ValueError(f"Cache backend '{name}' already registered.")
     _CACHE_BACKEND_REGISTRY[key] = cls
+    _resolve_cache_backend.cache_clear()
 
 
 def _register_eviction_policy(name: str, cls: Type[BaseEvictionPolicy]) -> None:
@@ -79,6 +81,7 @@ def _register_eviction_policy(name: str, cls: Type[BaseEvictionPolicy]) -> None:
     if key in _EVICTION_POLICY_REGISTRY:
         raise ValueError(f"Eviction policy '{name}' already registered.")
     _EVICTION_POLICY_REGISTRY[key] = cls
+    _resolve_eviction_policy.cache_clear()
 
 
 def _register_serializer(name: str, cls: Type[BaseSerializer]) -> None:
@@ -105,6 +108,130 @@ def _register_serializer(name: str, cls: Type[BaseSerializer]) -> None:
     if key in _SERIALIZER_REGISTRY:
         raise ValueError(f"Serializer '{name}' already registered.")
     _SERIALIZER_REGISTRY[key] = cls
+    _resolve_serializer.cache_clear()
+
+
+def _registry_snapshot() -> tuple:
+    """
+    Capture the current contents of all three registries.
+
+    Returns shallow copies, so registered classes themselves are shared.
+    Intended for test isolation: snapshot before mutating the process-global
+    registries, restore afterwards.
+
+    INTERNAL:
+        Pair with `_registry_restore`.
+    """
+
+    return (
+        dict(_CACHE_BACKEND_REGISTRY),
+        dict(_EVICTION_POLICY_REGISTRY),
+        dict(_SERIALIZER_REGISTRY),
+    )
+
+
+def _registry_restore(snapshot: tuple) -> None:
+    """
+    Restore all three registries to a previously captured snapshot.
+
+    Also clears the memoized resolvers, since entries added after the
+    snapshot may be cached there.
+
+    Args:
+        snapshot (tuple): Value returned by `_registry_snapshot`.
+
+    INTERNAL:
+        Pair with `_registry_snapshot`.
+    """
+
+    backends, policies, serializers = snapshot
+
+    _CACHE_BACKEND_REGISTRY.clear()
+    _CACHE_BACKEND_REGISTRY.update(backends)
+    _EVICTION_POLICY_REGISTRY.clear()
+    _EVICTION_POLICY_REGISTRY.update(policies)
+    _SERIALIZER_REGISTRY.clear()
+    _SERIALIZER_REGISTRY.update(serializers)
+
+    _resolve_cache_backend.cache_clear()
+    _resolve_eviction_policy.cache_clear()
+    _resolve_serializer.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_cache_backend(key: str) -> Type[BaseCacheBackend]:
+    """
+    Resolve a lowercased backend name to its registered class.
+
+    Memoized with lru_cache so repeated resolutions of the same name skip
+    the dict probe entirely; `_register_cache_backend` clears the cache
+    whenever the registry changes.
+
+    Raises:
+        ValueError: If no backend is registered under the given name.
+
+    INTERNAL:
+        Callers must lowercase the name before passing it in.
+    """
+
+    try:
+        return _CACHE_BACKEND_REGISTRY[key]
+    except KeyError:
+        raise ValueError(
+            f"Unknown cache backend '{key}'. "
+            f"Available: {list(_CACHE_BACKEND_REGISTRY.keys())}"
+        ) from None
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_eviction_policy(key: str) -> Type[BaseEvictionPolicy]:
+    """
+    Resolve a lowercased eviction policy name to its registered class.
+
+    Memoized with lru_cache; `_register_eviction_policy` clears the cache
+    whenever the registry changes. Only the name lookup is cached — the
+    caller instantiates a fresh policy per cache, since policies carry
+    per-cache state.
+
+    Raises:
+        ValueError: If no eviction policy is registered under the given name.
+
+    INTERNAL:
+        Callers must lowercase the name before passing it in.
+    """
+
+    try:
+        return _EVICTION_POLICY_REGISTRY[key]
+    except KeyError:
+        raise ValueError(
+            f"Unknown eviction policy '{key}'. "
+            f"Available: {list(_EVICTION_POLICY_REGISTRY.keys())}"
+        ) from None
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_serializer(key: str) -> Type[BaseSerializer]:
+    """
+    Resolve a lowercased serializer name to its registered class.
+
+    Memoized with lru_cache so repeated resolutions of the same name skip
+    the dict probe entirely; `_register_serializer` clears the cache
+    whenever the registry changes.
+
+    Raises:
+        ValueError: If no serializer is registered under the given name.
+
+    INTERNAL:
+        Callers must lowercase the name before passing it in.
+    """
+
+    try:
+        return _SERIALIZER_REGISTRY[key]
+    except KeyError:
+        raise ValueError(
+            f"Unknown serializer '{key}'. "
+            f"Available: {list(_SERIALIZER_REGISTRY.keys())}"
+        ) from None
 
 
 def create_cache_backend(name: str, config=None) -> BaseCacheBackend:
@@ -127,15 +254,7 @@ def create_cache_backend(name: str, config=None) -> BaseCacheBackend:
     Example:
         backend = create_cache_backend("file")
     """
-    try:
-        backend_cls = _CACHE_BACKEND_REGISTRY[name.lower()]
-    except KeyError:
-        raise ValueError(
-            f"Unknown cache backend '{name}'. "
-            f"Available: {list(_CACHE_BACKEND_REGISTRY.keys())}"
-        )
-
-    return backend_cls(config=config)
+    return _resolve_cache_backend(name.lower())(config=config)
 
 
 def create_eviction_policy(name: str) -> BaseEvictionPolicy:
@@ -159,15 +278,7 @@ def create_eviction_policy(name: str) -> BaseEvictionPolicy:
         policy = create_eviction_policy("lru")
     """
 
-    try:
-        return _EVICTION_POLICY_REGISTRY[
-            name.lower()
-        ]()  # end parenthesis to return a class object
-    except:
-        raise ValueError(
-            f"Unknown eviction policy '{name}'. "
-            f"Available: {list(_EVICTION_POLICY_REGISTRY.keys())}"
-        )
+    return _resolve_eviction_policy(name.lower())()
 
 
 def create_serializer(name: str) -> BaseSerializer:
@@ -191,10 +302,4 @@ def create_serializer(name: str) -> BaseSerializer:
         serializer = create_serializer("json")
     """
 
-    try:
-        return _SERIALIZER_REGISTRY[name.lower()]()
-    except KeyError:
-        raise ValueError(
-            f"Unknown serializer '{name}'. "
-            f"Available: {list(_SERIALIZER_REGISTRY.keys())}"
-        )
+    return _resolve_serializer(name.lower())()
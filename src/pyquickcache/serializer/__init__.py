@@ -2,5 +2,12 @@ from .base import BaseSerializer
 from .pickle import PickleSerializer
 from .json import JsonSerializer
 
+# Optional: registers only when the msgpack package is installed
+from . import msgpack as _msgpack  # noqa: F401
+
 # Optional: define __all__ to control what 'from serializer import *' does
 __all__ = ["BaseSerializer", "PickleSerializer", "JsonSerializer"]
+
+if _msgpack.msgpack is not None:
+    MsgpackSerializer = _msgpack.MsgpackSerializer
+    __all__.append("MsgpackSerializer")
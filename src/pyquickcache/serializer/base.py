@@ -47,6 +47,27 @@ class BaseSerializer(ABC):
         """
         pass
 
+    @property
+    def serializes_objects(self) -> bool:
+        """
+        Indicates whether the serializer can encode arbitrary Python objects.
+
+        The cache checks this at the persistence boundary: serializers that
+        return False receive entries converted through
+        CacheEntry.to_dict()/from_dict() (JSON-shaped data) instead of raw
+        CacheEntry objects. Defaults to `is_binary`, which matches pickle
+        (binary, arbitrary objects) and json (text, dicts only); formats
+        that are binary but JSON-shaped (e.g. MessagePack) override this
+        to False.
+
+        Returns:
+            bool: True if arbitrary objects can be serialized directly.
+
+        INTERNAL:
+            Override in subclasses where file mode and object support differ.
+        """
+        return self.is_binary
+
     @abstractmethod
     def serialize(self, data: Any) -> str | bytes:
         """
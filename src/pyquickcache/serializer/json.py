@@ -1,6 +1,11 @@
 from typing import Any
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 from .base import BaseSerializer
 
 from ..registry.decorators import register_serializer
@@ -15,6 +20,13 @@ class JsonSerializer(BaseSerializer):
     produces human-readable JSON with indentation and works with text data,
     not binary.
 
+    When the optional `orjson` package is installed, encoding and decoding
+    go through its Rust implementation instead of the pure-Python stdlib
+    encoder — typically several times faster for the metrics snapshots and
+    cache dumps written on every persistence call. The on-disk format stays
+    the same either way (2-space-indented UTF-8 JSON), so files written
+    with one encoder load fine with the other.
+
     Registered as "json" in the serializer registry.
 
     JSON serializer only supports serializable types. For arbitrary objects, use Pickle
@@ -42,7 +54,10 @@ class JsonSerializer(BaseSerializer):
         Indicates that JSON uses text, not binary, I/O.
 
         Returns:
-            bool: False, since JSON is a text format.
+            bool: False, since JSON is a text format. This also tells the
+            cache to convert entries through to_dict()/from_dict() at the
+            persistence boundary, so it must stay False regardless of which
+            encoder backs serialize().
 
         INTERNAL:
             Overrides BaseSerializer.is_binary.
@@ -62,7 +77,9 @@ class JsonSerializer(BaseSerializer):
         INTERNAL:
             Overrides BaseSerializer.serialize.
         """
-        return json.dumps(data, indent=4)
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2)
 
     def deserialize(self, data: str | bytes) -> Any:
         """
@@ -77,4 +94,6 @@ class JsonSerializer(BaseSerializer):
         INTERNAL:
             Overrides BaseSerializer.deserialize.
         """
+        if orjson is not None:
+            return orjson.loads(data)
         return json.loads(data)
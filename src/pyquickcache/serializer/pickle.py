@@ -60,7 +60,11 @@ class PickleSerializer(BaseSerializer):
         INTERNAL:
             Overrides BaseSerializer.serialize.
         """
-        return pickle.dumps(data)
+        # HIGHEST_PROTOCOL rather than the default: framed output and
+        # out-of-band-capable encoding make dumps measurably faster for
+        # large bytes-like values, and loads accepts any protocol, so old
+        # files keep working
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
 
     def deserialize(self, data: str | bytes) -> Any:
         """
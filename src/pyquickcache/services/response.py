@@ -1,9 +1,18 @@
-from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 
-@dataclass(slots=True)
-class CacheResponse:
+class CacheResponse(NamedTuple):
+    """
+    Result envelope for service-layer cache operations.
+
+    A NamedTuple rather than a dataclass: construction runs through the
+    C-implemented tuple constructor instead of Python-level attribute
+    assignments, and instances are immutable and unpackable. The core
+    QuickCache API returns raw values directly and does not allocate one
+    of these per operation; this envelope is for service boundaries that
+    want an explicit success/message wrapper.
+    """
+
     success: bool
     message: str
     data: Optional[Any] = None
@@ -3,7 +3,7 @@
 import os
 import sys
 from datetime import datetime
-from typing import Optional, Union
+from typing import Union
 
 
 class FileManager:
@@ -57,7 +57,10 @@ class FileManager:
         return os.getcwd()
 
     def resolve_path(
-        self, user_input: Optional[str], extension: str, use_timestamp: bool = False
+        self,
+        user_input: Union[str, os.PathLike, None],
+        extension: str,
+        use_timestamp: bool = False,
     ) -> str:
         """
         Resolve the final file path based on user input and defaults.
@@ -72,8 +75,9 @@ class FileManager:
         - Target directories are created automatically if missing
 
         Args:
-            user_input (Optional[str]): User-provided file path, directory,
-                filename, or None.
+            user_input (str | os.PathLike | None): User-provided file path,
+                directory, filename, or None. Path objects are handled by
+                the os.path machinery directly, with no stringify round-trip.
             extension (str): File extension to enforce (without dot).
             use_timestamp (bool): Whether to append a timestamp to the filename.
 
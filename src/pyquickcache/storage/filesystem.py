@@ -32,13 +32,44 @@ class FileSystemStorage(StorageBackend):
         self.filepath = filepath
         self.use_timestamp = use_timestamp
 
-    def save(self, data: Any) -> None:
-        try:
-            path = self.file_manager.resolve_path(
+        # Memoized non-timestamped path: filepath, serializer, and defaults
+        # are fixed for this instance, so the resolution (project-root
+        # inference, isdir stat, makedirs) only needs to run once.
+        # Timestamped saves bypass it, since each one names a new file.
+        self._static_path: str | None = None
+
+    def _resolve_static_path(self) -> str:
+        """
+        INTERNAL.
+
+        Resolve and memoize the instance's non-timestamped file path.
+
+        The first call pays the full resolve_path walk (including the
+        directory creation side effect); later calls return the cached
+        string. Deleting the storage directory mid-run therefore surfaces
+        as an I/O error on the next read/write rather than being silently
+        re-created.
+        """
+        path = self._static_path
+        if path is None:
+            path = self._static_path = self.file_manager.resolve_path(
                 self.filepath,
                 extension=self.serializer.extension,
-                use_timestamp=self.use_timestamp,
+                use_timestamp=False,
             )
+        return path
+
+    def save(self, data: Any) -> None:
+        try:
+            if self.use_timestamp:
+                # Every timestamped save targets a fresh filename
+                path = self.file_manager.resolve_path(
+                    self.filepath,
+                    extension=self.serializer.extension,
+                    use_timestamp=True,
+                )
+            else:
+                path = self._resolve_static_path()
             serialized = self.serializer.serialize(data)
             self.file_manager.write(path, serialized)
         except Exception as e:
@@ -46,11 +77,7 @@ class FileSystemStorage(StorageBackend):
 
     def load(self) -> Any:
         try:
-            path = self.file_manager.resolve_path(
-                self.filepath,
-                extension=self.serializer.extension,
-                use_timestamp=False,
-            )
+            path = self._resolve_static_path()
             raw = self.file_manager.read(path, binary=self.serializer.is_binary)
             return self.serializer.deserialize(raw)
         except Exception as e:
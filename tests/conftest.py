@@ -20,3 +20,92 @@ def cache():
 
 
 """
+
+import pytest
+
+from pyquickcache.registry.registry import _registry_snapshot, _registry_restore
+
+
+@pytest.fixture(autouse=True)
+def _isolated_registry():
+    """Snapshot the process-global registries around every test.
+
+    Registrations are process-global, so a test that registers a policy or
+    serializer would otherwise leak it into every later test, forcing
+    module-load ordering and blocking parallel runs. With this fixture each
+    test sees the built-in registrations plus only its own.
+    """
+    snapshot = _registry_snapshot()
+    yield
+    _registry_restore(snapshot)
+
+
+@pytest.fixture
+def register_test_policy():
+    """Factory fixture: build and register a stub eviction policy.
+
+    The bases and decorators are imported lazily, so files that never use
+    the fixture don't pay those imports at collection time. Registrations
+    made through the returned callable are undone by _isolated_registry.
+    """
+    from pyquickcache.decorators import register_eviction_policy
+    from pyquickcache.eviction_policy import BaseEvictionPolicy
+
+    def _register(name: str):
+        @register_eviction_policy(name)
+        class DecoratorEvictionPolicy(BaseEvictionPolicy):
+            """Test eviction policy registered via decorator."""
+
+            def on_add(self, cache, key):
+                pass
+
+            def on_update(self, cache, key):
+                pass
+
+            def on_access(self, cache, key):
+                pass
+
+            def on_delete(self, cache, key):
+                pass
+
+            def select_eviction_key(self, cache):
+                if not cache:
+                    raise RuntimeError("Eviction requested on empty cache")
+                return next(iter(cache))
+
+        return DecoratorEvictionPolicy
+
+    return _register
+
+
+@pytest.fixture
+def register_test_serializer():
+    """Factory fixture: build and register a stub serializer.
+
+    Same lazy-import and isolation story as register_test_policy.
+    """
+    from pyquickcache.decorators import register_serializer
+    from pyquickcache.serializer import BaseSerializer
+
+    def _register(name: str):
+        @register_serializer(name)
+        class DecoratorSerializer(BaseSerializer):
+            """Test serializer registered via decorator."""
+
+            @property
+            def extension(self):
+                return "txt"
+
+            @property
+            def is_binary(self):
+                return False
+
+            def serialize(self, data):
+                return str(data)
+
+            def deserialize(self, data):
+                return data
+
+        return DecoratorSerializer
+
+    return _register
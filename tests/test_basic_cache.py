@@ -1,3 +1,4 @@
+import pickle
 import time
 import pytest
 import tempfile
@@ -303,3 +304,21 @@ def test_repr(cache):
 def test_stop_is_idempotent(cache):
     cache.stop()
     cache.stop()  # should not raise
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        KeyNotFound(key="a"),
+        KeyExpired(key="a"),
+        KeyAlreadyExists(key="a"),
+        InvalidTTL(ttl=-1),
+        CacheSaveError("cache.json"),
+        CacheLoadError("cache.json"),
+        CacheMetricsSaveError("metrics.json"),
+    ],
+)
+def test_exceptions_survive_pickling(error):
+    restored = pickle.loads(pickle.dumps(error))
+    assert type(restored) is type(error)
+    assert str(restored) == str(error)
@@ -14,6 +14,8 @@ def make_cache(eviction_policy: str):
         default_ttl=60,
         eviction_policy=eviction_policy,
         cleanup_interval=0,
+        # Single-threaded tests: skip the lock and the sweeper thread
+        thread_safe=False,
     )
     return QuickCache(config)
 
@@ -88,6 +90,33 @@ def test_lfu_eviction():
         cache.get("b")
 
 
+def test_lfu_fast_eviction():
+    # Same scenario as "lfu", but with set-backed buckets (no LRU
+    # tie-break); exercises the unordered add/access/delete paths
+    cache = make_cache("lfu-fast")
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Increase frequency of 'a'
+    cache.get("a")
+    cache.get("a")
+
+    # 'b' has lower frequency → should be evicted
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    with pytest.raises(KeyNotFound):
+        cache.get("b")
+
+    # Explicit delete drains the unordered bucket path too
+    cache.delete("c")
+    with pytest.raises(KeyNotFound):
+        cache.get("c")
+
+
 # ---------------------------------------------------------------------
 # Edge cases
 # ---------------------------------------------------------------------
@@ -8,60 +8,29 @@ from pyquickcache.registry.registry import (
     create_eviction_policy,
     create_serializer,
 )
-from pyquickcache.eviction_policy import BaseEvictionPolicy
-from pyquickcache.serializer import BaseSerializer
+
+# The stub policy/serializer classes live behind the register_test_policy /
+# register_test_serializer factory fixtures in conftest.py; combined with
+# the autouse registry snapshot, every test registers exactly what it needs
+# and leaves nothing behind.
 
 # ---------------------------------------------------------------------
 # Eviction Policy Registration (Decorator-based)
 # ---------------------------------------------------------------------
 
 
-@register_eviction_policy("decorator_policy")
-class DecoratorEvictionPolicy(BaseEvictionPolicy):
-    """Test eviction policy registered via decorator."""
-
-    def on_add(self, cache, key):
-        pass
-
-    def on_update(self, cache, key):
-        pass
-
-    def on_access(self, cache, key):
-        pass
-
-    def on_delete(self, cache, key):
-        pass
-
-    def select_eviction_key(self, cache):
-        if not cache:
-            raise RuntimeError("Eviction requested on empty cache")
-        return next(iter(cache))
+def test_eviction_policy_registered_via_decorator(register_test_policy):
+    policy_cls = register_test_policy("decorator_policy")
 
-
-def test_eviction_policy_registered_via_decorator():
     policy = create_eviction_policy("decorator_policy")
-    assert isinstance(policy, DecoratorEvictionPolicy)
-
-
-def test_duplicate_eviction_policy_registration_raises():
-    with pytest.raises(ValueError):
-
-        @register_eviction_policy("decorator_policy")
-        class DuplicateEvictionPolicy(BaseEvictionPolicy):
-            def on_add(self, cache, key):
-                pass
-
-            def on_update(self, cache, key):
-                pass
+    assert isinstance(policy, policy_cls)
 
-            def on_access(self, cache, key):
-                pass
 
-            def on_delete(self, cache, key):
-                pass
+def test_duplicate_eviction_policy_registration_raises(register_test_policy):
+    register_test_policy("decorator_policy")
 
-            def select_eviction_key(self, cache):
-                return None
+    with pytest.raises(ValueError):
+        register_test_policy("decorator_policy")
 
 
 def test_invalid_eviction_policy_base_raises():
@@ -82,48 +51,18 @@ def test_unknown_eviction_policy_raises():
 # ---------------------------------------------------------------------
 
 
-@register_serializer("decorator_serializer")
-class DecoratorSerializer(BaseSerializer):
-    """Test serializer registered via decorator."""
-
-    @property
-    def extension(self):
-        return "txt"
-
-    @property
-    def is_binary(self):
-        return False
-
-    def serialize(self, data):
-        return str(data)
-
-    def deserialize(self, data):
-        return data
-
+def test_serializer_registered_via_decorator(register_test_serializer):
+    serializer_cls = register_test_serializer("decorator_serializer")
 
-def test_serializer_registered_via_decorator():
     serializer = create_serializer("decorator_serializer")
-    assert isinstance(serializer, DecoratorSerializer)
+    assert isinstance(serializer, serializer_cls)
 
 
-def test_duplicate_serializer_registration_raises():
-    with pytest.raises(ValueError):
-
-        @register_serializer("decorator_serializer")
-        class DuplicateSerializer(BaseSerializer):
-            @property
-            def extension(self):
-                return "txt"
-
-            @property
-            def is_binary(self):
-                return False
+def test_duplicate_serializer_registration_raises(register_test_serializer):
+    register_test_serializer("decorator_serializer")
 
-            def serialize(self, data):
-                return data
-
-            def deserialize(self, data):
-                return data
+    with pytest.raises(ValueError):
+        register_test_serializer("decorator_serializer")
 
 
 def test_invalid_serializer_base_raises():
@@ -1,4 +1,3 @@
-import tempfile
 import pytest
 
 from pyquickcache import QuickCache, QuickCacheConfig
@@ -14,117 +13,126 @@ def make_cache(serializer: str):
         serializer=serializer,
         default_ttl=60,
         cleanup_interval=0,
+        # Single-threaded tests: skip the lock and the sweeper thread
+        thread_safe=False,
     )
     return QuickCache(config)
 
 
-# ---------------------------------------------------------------------
-# JSON Serializer
-# ---------------------------------------------------------------------
-
-
-def test_json_serializer_save_and_load():
-    cache = make_cache("json")
+# Dummy custom object to be pickled by a test
+# We need to define it outside the test since pickle cannot serialize local objects
+class Dummy:
+    def __init__(self, value):
+        self.value = value
 
-    cache.set("a", {"city": "Delhi", "population": 30})
-    cache.set("b", [1, 2, 3])
+    def __eq__(self, other):
+        return isinstance(other, Dummy) and self.value == other.value
 
-    with tempfile.TemporaryDirectory() as tmp:
-        path = f"{tmp}/cache_json"
 
-        cache.save_to_disk(filepath=path)
-        cache.clear()
+# Built once at import: parametrize rows are evaluated at collection time,
+# so repeated runs reuse the same payload object
+_DUMMY = Dummy(123)
 
-        with pytest.raises(KeyNotFound):
-            cache.get("a")
 
-        cache.load_from_disk(filepath=path)
+# ---------------------------------------------------------------------
+# Round trips (parametrized across serializers)
+# ---------------------------------------------------------------------
 
-        assert cache.get("a") == {"city": "Delhi", "population": 30}
-        assert cache.get("b") == [1, 2, 3]
 
+@pytest.mark.parametrize(
+    "serializer,payload",
+    [
+        ("json", {"a": {"city": "Delhi", "population": 30}, "b": [1, 2, 3]}),
+        ("pickle", {"a": {"x": 1, "y": [1, 2, 3]}, "b": ("tuple", 42)}),
+    ],
+)
+def test_serializer_save_and_load(tmp_path, serializer, payload):
+    cache = make_cache(serializer)
 
-def test_json_serializer_handles_primitives():
-    cache = make_cache("json")
+    for key, value in payload.items():
+        cache.set(key, value)
 
-    cache.set("int", 1)
-    cache.set("str", "hello")
-    cache.set("bool", True)
+    # A pathlib.Path passes straight through resolve_path (os.path
+    # accepts PathLike); one object serves both the save and the load
+    path = tmp_path / f"cache_{serializer}"
 
-    with tempfile.TemporaryDirectory() as tmp:
-        path = f"{tmp}/cache_json_primitives"
+    cache.save_to_disk(filepath=path)
+    cache.clear()
 
-        cache.save_to_disk(filepath=path)
-        cache.clear()
-        cache.load_from_disk(filepath=path)
+    with pytest.raises(KeyNotFound):
+        cache.get("a")
 
-        assert cache.get("int") == 1
-        assert cache.get("str") == "hello"
-        assert cache.get("bool") is True
+    cache.load_from_disk(filepath=path)
 
+    for key, value in payload.items():
+        assert cache.get(key) == value
 
-# ---------------------------------------------------------------------
-# Pickle Serializer
-# ---------------------------------------------------------------------
 
+@pytest.mark.parametrize(
+    "serializer,payload",
+    [
+        # JSON must round-trip the primitive types losslessly
+        ("json", {"int": 1, "str": "hello", "bool": True}),
+        # Pickle must round-trip arbitrary custom objects
+        ("pickle", {"obj": _DUMMY}),
+    ],
+)
+def test_serializer_round_trips_values(tmp_path, serializer, payload):
+    cache = make_cache(serializer)
 
-def test_pickle_serializer_save_and_load():
-    cache = make_cache("pickle")
+    for key, value in payload.items():
+        cache.set(key, value)
 
-    cache.set("a", {"x": 1, "y": [1, 2, 3]})
-    cache.set("b", ("tuple", 42))
+    path = tmp_path / f"cache_{serializer}_values"
 
-    with tempfile.TemporaryDirectory() as tmp:
-        path = f"{tmp}/cache_pickle"
+    cache.save_to_disk(filepath=path)
+    cache.clear()
+    cache.load_from_disk(filepath=path)
 
-        cache.save_to_disk(filepath=path)
-        cache.clear()
+    for key, value in payload.items():
+        loaded = cache.get(key)
+        assert loaded == value
+        assert type(loaded) is type(value)
 
-        with pytest.raises(KeyNotFound):
-            cache.get("a")
 
-        cache.load_from_disk(filepath=path)
+def test_pickle_serializer_rejects_unpicklable_objects():
+    cache = make_cache("pickle")
 
-        assert cache.get("a") == {"x": 1, "y": [1, 2, 3]}
-        assert cache.get("b") == ("tuple", 42)
+    class Dummy:
+        def __init__(self, x):
+            self.x = x
 
+    cache.set("obj", Dummy(1))
 
-# Dummy custom object to be pickled by a test
-# We need to define it outside the test since pickle cannot serialize local objects
-class Dummy:
-    def __init__(self, value):
-        self.value = value
+    with pytest.raises(CacheSaveError):
+        cache.save_to_disk()
 
-    def __eq__(self, other):
-        return isinstance(other, Dummy) and self.value == other.value
 
+# ---------------------------------------------------------------------
+# MessagePack Serializer (optional dependency)
+# ---------------------------------------------------------------------
 
-def test_pickle_serializer_handles_custom_objects():
-    cache = make_cache("pickle")
 
-    obj = Dummy(123)
-    cache.set("obj", obj)
+def test_msgpack_serializer_save_and_load(tmp_path):
+    pytest.importorskip("msgpack")
 
-    with tempfile.TemporaryDirectory() as tmp:
-        path = f"{tmp}/cache_pickle_obj"
-        cache.save_to_disk(filepath=path)
-        cache.clear()
-        cache.load_from_disk(filepath=path)
+    cache = make_cache("msgpack")
 
-        assert cache.get("obj") == obj
+    cache.set("a", {"city": "Delhi", "population": 30})
+    cache.set("b", [1, 2, 3])
 
+    path = tmp_path / "cache_msgpack"
 
-def test_pickle_serializer_rejects_unpicklable_objects():
-    cache = make_cache("pickle")
+    cache.save_to_disk(filepath=path)
+    cache.clear()
 
-    class Dummy:
-        def __init__(self, x):
-            self.x = x
+    with pytest.raises(KeyNotFound):
+        cache.get("a")
 
-    cache.set("obj", Dummy(1))
+    cache.load_from_disk(filepath=path)
 
-    with pytest.raises(CacheSaveError):
-        cache.save_to_disk()
+    assert cache.get("a") == {"city": "Delhi", "population": 30}
+    assert cache.get("b") == [1, 2, 3]
 
 
 # ---------------------------------------------------------------------